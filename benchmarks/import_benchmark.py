@@ -0,0 +1,61 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+MODULE = 'smart_tsp_benchmark.tsp_benchmark'
+FORBIDDEN = ('matplotlib', 'scipy')
+
+
+def measure(module: str) -> Tuple[int, List[Tuple[str, int, int]], List[str]]:
+    check = (f"import sys, {module}; "
+             f"print(','.join(sorted({{m.split('.')[0] for m in sys.modules}} & set({FORBIDDEN!r}))))")
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', check],
+                             capture_output=True, text=True, check=True)
+
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    total = next(cumulative for name, _, cumulative in imports if name == module)
+    loaded = [name for name in process.stdout.strip().split(',') if name]
+    return total, imports, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget of the benchmark module")
+    parser.add_argument('--module', default=MODULE)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    totals = sorted(total for total, _, _ in runs)
+    median_ms = totals[len(totals) // 2] / 1000
+    _, imports, loaded = runs[-1]
+
+    print(f"{args.module}: median {median_ms:.1f} ms, min {totals[0] / 1000:.1f} ms over {args.runs} run(s)")
+    print(f"Top {args.top} imports by self time:")
+    slowest: Dict[str, int] = {}
+    for name, self_us, _ in imports:
+        slowest[name] = max(slowest.get(name, 0), self_us)
+    for name, self_us in sorted(slowest.items(), key=lambda x: -x[1])[:args.top]:
+        print(f"  {self_us / 1000:8.2f} ms  {name}")
+
+    failed = False
+    if loaded:
+        print(f"Eagerly imported heavy dependencies: {', '.join(loaded)}")
+        failed = True
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        print(f"Import budget exceeded: {median_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
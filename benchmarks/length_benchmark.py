@@ -0,0 +1,65 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+from scipy.spatial import distance
+
+from smart_tsp_benchmark.calculators.distance import DistanceOracle
+from smart_tsp_benchmark.calculators.length import calculate_length, calculate_lengths
+from smart_tsp_benchmark.generators.points import generate_points
+
+
+def legacy_calculate_length(points: np.ndarray, route: List[int]) -> float:
+    return sum(distance.euclidean(points[route[i]], points[route[i + 1]])
+               for i in range(len(route) - 1))
+
+
+def best_time(func: Callable, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Route length engine micro-benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--batch', type=int, default=16)
+    args = parser.parse_args()
+
+    header = (f"{'Points':>10} | {'Legacy (s)':>11} | {'Vectorized (s)':>14} | {'Speedup':>9} | "
+              f"{'Batch/route (s)':>15} | {'Matrix build (s)':>16} | {'Matrix/route (s)':>16}")
+    print(header)
+    print("-" * len(header))
+
+    rng = np.random.default_rng(0)
+    for n in args.sizes:
+        points = generate_points(n, seed=0)
+        route_list = rng.permutation(n).tolist()
+        route_array = np.asarray(route_list, dtype=np.int32)
+        batch = np.stack([rng.permutation(n).astype(np.int32) for _ in range(args.batch)])
+
+        legacy = best_time(lambda: legacy_calculate_length(points, route_list), 1 if n >= 100_000 else args.repeat)
+        vectorized = best_time(lambda: calculate_length(points, route_array), args.repeat)
+        batched = best_time(lambda: calculate_lengths(points, batch), args.repeat) / args.batch
+
+        oracle = DistanceOracle(points)
+        build, matrix = "-", "-"
+        if oracle.strategy != 'direct':
+            build = f"{best_time(oracle.build_matrix, 1):.4f}"
+            matrix = f"{best_time(lambda: oracle.lengths(batch), args.repeat) / args.batch:.6f}"
+
+        assert np.isclose(legacy_calculate_length(points, route_list[:1000]),
+                          calculate_length(points, route_list[:1000]))
+
+        print(f"{n:>10,} | {legacy:>11.4f} | {vectorized:>14.6f} | {legacy / vectorized:>8.1f}x | {batched:>15.6f} | "
+              f"{build:>16} | {matrix:>16}")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,7 @@ def main():
         'seed': 777,
         'point_generation': 'random',
         'use_post_optimization': False,
+        'post_optimization_strategy': 'window',
         'plot_results': False,
         'verbose': True
     }
@@ -0,0 +1,118 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from smart_tsp_benchmark.calculators.length import (BATCH_CHUNK_NODES, _as_points_array, _as_route_array,
+                                                     calculate_length, calculate_lengths)
+from smart_tsp_benchmark.calculators.tour import Route
+
+DEFAULT_MEMORY_BUDGET = 512 * 1024 ** 2
+STRATEGIES = ('auto', 'matrix', 'direct')
+
+
+class DistanceOracle:
+
+    def __init__(self, points: np.ndarray, memory_budget: Optional[int] = DEFAULT_MEMORY_BUDGET,
+                 strategy: str = 'auto'):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown distance strategy: {strategy}")
+        self.points = _as_points_array(points)
+        self.n = len(self.points)
+        self.pairs = self.n * (self.n - 1) // 2
+        fits = memory_budget is None or self.pairs * np.dtype(np.float32).itemsize <= memory_budget
+        if strategy == 'matrix' and not fits:
+            raise ValueError(f"Distance matrix for {self.n} points exceeds the memory budget of {memory_budget} bytes")
+        self.strategy = strategy if fits else 'direct'
+        self.matrix: Optional[np.ndarray] = None
+        self.row_start: Optional[np.ndarray] = None
+        self.direct_edges = 0
+
+    @property
+    def matrix_bytes(self) -> int:
+        return self.pairs * np.dtype(np.float32).itemsize
+
+    def build_matrix(self) -> np.ndarray:
+        if self.matrix is None:
+            matrix = np.empty(self.pairs, dtype=np.float32)
+            xs, ys = np.ascontiguousarray(self.points[:, 0]), np.ascontiguousarray(self.points[:, 1])
+            dx, dy = np.empty_like(xs), np.empty_like(ys)
+            offset = 0
+            for i in range(self.n - 1):
+                count = self.n - i - 1
+                row_dx = np.subtract(xs[i + 1:], xs[i], out=dx[:count])
+                row_dy = np.subtract(ys[i + 1:], ys[i], out=dy[:count])
+                row_dx *= row_dx
+                row_dy *= row_dy
+                row_dx += row_dy
+                np.sqrt(row_dx, out=row_dx)
+                matrix[offset:offset + count] = row_dx
+                offset += count
+            rows = np.arange(self.n, dtype=np.int64)
+            self.row_start = rows * self.n - rows * (rows + 1) // 2 - rows - 1
+            self.matrix = matrix
+        return self.matrix
+
+    def _use_matrix(self, edges: int) -> bool:
+        if self.matrix is not None:
+            return True
+        if self.strategy == 'direct':
+            return False
+        if self.strategy == 'matrix' or self.direct_edges + edges >= self.pairs:
+            self.build_matrix()
+            return True
+        self.direct_edges += edges
+        return False
+
+    def _lookup(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        low = np.minimum(i, j)
+        high = np.maximum(i, j)
+        same = low == high
+        index = np.where(same, 0, self.row_start[low] + high)
+        return np.where(same, np.float32(0.0), self.matrix[index])
+
+    def _direct(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        steps = self.points[j] - self.points[i]
+        return np.sqrt(np.einsum('...k,...k->...', steps, steps))
+
+    def edge_costs(self, i_idx, j_idx) -> np.ndarray:
+        i_idx, j_idx = np.broadcast_arrays(_as_route_array(i_idx), _as_route_array(j_idx))
+        if i_idx.size == 0:
+            return np.zeros(i_idx.shape, dtype=np.float64)
+        if self._use_matrix(i_idx.size):
+            return self._lookup(i_idx, j_idx).astype(np.float64)
+        return self._direct(i_idx, j_idx)
+
+    def length(self, route: Route, closed: bool = False) -> float:
+        route = _as_route_array(route)
+        if len(route) < 2:
+            return 0.0
+        if not self._use_matrix(len(route)):
+            return calculate_length(self.points, route, closed)
+        successors = np.roll(route, -1) if closed else route[1:]
+        return float(self._lookup(route[:len(successors)], successors).sum(dtype=np.float64))
+
+    def lengths(self, routes: Union[np.ndarray, Sequence[Route]], closed: bool = False) -> np.ndarray:
+        if not isinstance(routes, np.ndarray):
+            routes = list(routes)
+            if len({len(route) for route in routes}) > 1:
+                return np.array([self.length(route, closed) for route in routes], dtype=np.float64)
+            routes = np.asarray(routes)
+
+        if routes.ndim != 2:
+            raise ValueError(f"Routes must be a 2D array of shape (n_routes, n_nodes), got {routes.shape}")
+        lengths = np.zeros(routes.shape[0], dtype=np.float64)
+        if routes.shape[1] < 2:
+            return lengths
+        if not np.issubdtype(routes.dtype, np.integer):
+            raise TypeError(f"Routes must contain integer indices, got {routes.dtype}")
+
+        if not self._use_matrix(routes.size):
+            return calculate_lengths(self.points, routes, closed)
+        chunk = max(1, BATCH_CHUNK_NODES // routes.shape[1])
+        for start in range(0, routes.shape[0], chunk):
+            block = routes[start:start + chunk]
+            successors = np.roll(block, -1, axis=1) if closed else block[:, 1:]
+            costs = self._lookup(block[:, :successors.shape[1]], successors)
+            lengths[start:start + chunk] = costs.sum(axis=1, dtype=np.float64)
+        return lengths
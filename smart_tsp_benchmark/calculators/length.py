@@ -1,10 +1,67 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
-from typing import List
+from typing import Sequence, Union
 
 import numpy as np
-from scipy.spatial import distance
 
+from smart_tsp_benchmark.calculators.tour import Route
 
-def calculate_length(points: np.ndarray, route: List[int]) -> float:
-    return sum(distance.euclidean(points[route[i]], points[route[i + 1]])
-               for i in range(len(route) - 1))
+BATCH_CHUNK_NODES = 1 << 20
+
+
+def _as_route_array(route: Route) -> np.ndarray:
+    route = np.asarray(route)
+    if route.size == 0:
+        return route.astype(np.intp)
+    if not np.issubdtype(route.dtype, np.integer):
+        raise TypeError(f"Route must contain integer indices, got {route.dtype}")
+    return route
+
+
+def _as_points_array(points: np.ndarray) -> np.ndarray:
+    points = np.asarray(points)
+    if points.dtype not in (np.float32, np.float64):
+        points = points.astype(np.float64)
+    return points
+
+
+def calculate_length(points: np.ndarray, route: Route, closed: bool = False) -> float:
+    route = _as_route_array(route)
+    if len(route) < 2:
+        return 0.0
+
+    points = _as_points_array(points)
+    path = points[route]
+    if closed:
+        path = np.concatenate([path, path[:1]])
+
+    steps = np.diff(path, axis=0)
+    return float(np.sqrt(np.einsum('ij,ij->i', steps, steps)).sum(dtype=np.float64))
+
+
+def calculate_lengths(points: np.ndarray, routes: Union[np.ndarray, Sequence[Route]],
+                      closed: bool = False) -> np.ndarray:
+    points = _as_points_array(points)
+
+    if not isinstance(routes, np.ndarray):
+        routes = list(routes)
+        if len({len(route) for route in routes}) > 1:
+            return np.array([calculate_length(points, route, closed) for route in routes],
+                            dtype=np.float64)
+        routes = np.asarray(routes)
+
+    if routes.ndim != 2:
+        raise ValueError(f"Routes must be a 2D array of shape (n_routes, n_nodes), got {routes.shape}")
+    if routes.shape[1] < 2:
+        return np.zeros(routes.shape[0], dtype=np.float64)
+    if not np.issubdtype(routes.dtype, np.integer):
+        raise TypeError(f"Routes must contain integer indices, got {routes.dtype}")
+
+    lengths = np.empty(routes.shape[0], dtype=np.float64)
+    chunk = max(1, BATCH_CHUNK_NODES // routes.shape[1])
+    for start in range(0, routes.shape[0], chunk):
+        block = routes[start:start + chunk]
+        if closed:
+            block = np.concatenate([block, block[:, :1]], axis=1)
+        steps = np.diff(points[block], axis=1)
+        lengths[start:start + chunk] = np.sqrt(np.einsum('rij,rij->ri', steps, steps)).sum(axis=1, dtype=np.float64)
+    return lengths
@@ -0,0 +1,42 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from typing import List, Optional, Union
+
+import numpy as np
+
+Route = Union[List[int], np.ndarray]
+
+INT32_NODES = np.iinfo(np.int32).max
+
+
+def route_dtype(n_points: int) -> np.dtype:
+    return np.dtype(np.int32) if n_points <= INT32_NODES else np.dtype(np.int64)
+
+
+def as_route(route: Route, n_points: Optional[int] = None) -> np.ndarray:
+    route = np.asarray(route)
+    return np.ascontiguousarray(route, dtype=route_dtype(len(route) if n_points is None else n_points))
+
+
+def validate_tour(route: Route, n_points: int) -> Optional[str]:
+    if route is None:
+        return "Route is missing"
+    route = np.asarray(route)
+    if route.ndim != 1:
+        return f"Route must be one-dimensional, got shape {route.shape}"
+    if len(route) != n_points:
+        return f"Route visits {len(route)} nodes, expected {n_points}"
+    if n_points == 0:
+        return None
+    if route.dtype.kind not in 'iu':
+        return f"Route must contain integer indices, got {route.dtype}"
+
+    low, high = int(route.min()), int(route.max())
+    if low < 0 or high >= n_points:
+        return f"Route index {low if low < 0 else high} out of range [0, {n_points})"
+
+    seen = np.zeros(n_points, dtype=bool)
+    seen[route] = True
+    missing = n_points - int(np.count_nonzero(seen))
+    if missing:
+        return f"Route repeats {missing} visit(s) and misses {missing} node(s)"
+    return None
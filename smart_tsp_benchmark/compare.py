@@ -0,0 +1,249 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import json
+import math
+import os
+import time
+import traceback
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BASELINE_VERSION = 1
+INSTANCE_KEYS = ('n_points', 'seed', 'point_generation', 'point_dtype', 'instance', 'closed_tour',
+                 'point_order', 'use_post_optimization', 'post_optimization_strategy')
+
+
+def min_p_value(repeats: int) -> float:
+    return 1 / math.comb(2 * repeats, repeats)
+
+
+def slower_p_value(current: Sequence[float], baseline: Sequence[float]) -> float:
+    from scipy.stats import mannwhitneyu
+
+    return float(mannwhitneyu(current, baseline, alternative='greater').pvalue)
+
+
+def faster_p_value(current: Sequence[float], baseline: Sequence[float]) -> float:
+    from scipy.stats import mannwhitneyu
+
+    return float(mannwhitneyu(current, baseline, alternative='less').pvalue)
+
+
+def bootstrap_median_ratio(current: Sequence[float], baseline: Sequence[float], samples: int = 2000,
+                           confidence: float = 0.95, seed: int = 0) -> Tuple[float, float]:
+    current = np.asarray(current, dtype=np.float64)
+    baseline = np.asarray(baseline, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    current_medians = np.median(rng.choice(current, size=(samples, len(current))), axis=1)
+    baseline_medians = np.median(rng.choice(baseline, size=(samples, len(baseline))), axis=1)
+    ratios = current_medians / np.maximum(baseline_medians, np.finfo(np.float64).tiny)
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(ratios, [tail, 100 - tail])
+    return float(low), float(high)
+
+
+def collect_samples(benchmark, repeats: int, warmup: int) -> Dict[str, Dict]:
+    benchmark.prepare_instance()
+    algorithms = {name: config for name, config in benchmark.algorithms.items() if config.enabled}
+    samples = {name: {'params': json.loads(config.params_key()), 'times': [], 'lengths': []}
+               for name, config in algorithms.items()}
+
+    for round_index in range(warmup + repeats):
+        for name, config in algorithms.items():
+            entry = samples[name]
+            if 'error' in entry:
+                continue
+            try:
+                measurement = benchmark.time_algorithm(config)
+            except Exception:
+                entry['error'] = traceback.format_exc()
+                continue
+            if measurement.get('invalid'):
+                entry['error'] = f"Invalid tour: {measurement['invalid']}"
+                continue
+            if round_index >= warmup:
+                entry['times'].append(measurement['solve_time'] + measurement['post_opt_time'])
+                entry['lengths'].append(benchmark.evaluate_route(measurement['route']))
+    return samples
+
+
+def load_baseline(path: str) -> Dict:
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}: {baseline.get('version')}")
+    return baseline
+
+
+def save_baseline(path: str, config: Dict, samples: Dict[str, Dict]):
+    from smart_tsp_benchmark.reporting.sinks import collect_environment
+
+    baseline = {
+        'version': BASELINE_VERSION,
+        'created': time.time(),
+        'config': {key: config[key] for key in INSTANCE_KEYS},
+        'environment': collect_environment(),
+        'algorithms': samples
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(baseline, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def compare_algorithm(current: Dict, baseline: Dict, cfg: Dict) -> Dict:
+    entry = {'params_changed': current['params'] != baseline['params']}
+    if 'error' in current:
+        return {**entry, 'verdict': 'error', 'error': current['error']}
+    if 'error' in baseline or not baseline['times']:
+        return {**entry, 'verdict': 'new'}
+
+    base_time = float(np.median(baseline['times']))
+    current_time = float(np.median(current['times']))
+    time_ratio = current_time / base_time if base_time else float('inf')
+    ci_low, ci_high = bootstrap_median_ratio(current['times'], baseline['times'],
+                                             cfg['bootstrap_samples'], cfg['confidence'])
+    p_slower = slower_p_value(current['times'], baseline['times'])
+    p_faster = faster_p_value(current['times'], baseline['times'])
+
+    base_length = float(np.median(baseline['lengths']))
+    current_length = float(np.median(current['lengths']))
+    length_ratio = current_length / base_length if base_length else 1.0
+
+    time_regression = p_slower < cfg['alpha'] and time_ratio > 1 + cfg['time_tolerance']
+    time_improvement = p_faster < cfg['alpha'] and time_ratio < 1 - cfg['time_tolerance']
+    length_regression = length_ratio > 1 + cfg['length_tolerance']
+    length_improvement = length_ratio < 1 - cfg['length_tolerance']
+
+    if time_regression or length_regression:
+        verdict = 'regression'
+    elif time_improvement or length_improvement:
+        verdict = 'improvement'
+    else:
+        verdict = 'unchanged'
+
+    return {
+        **entry,
+        'verdict': verdict,
+        'baseline_time': base_time,
+        'current_time': current_time,
+        'time_ratio': time_ratio,
+        'time_ratio_ci': (ci_low, ci_high),
+        'p_slower': p_slower,
+        'p_faster': p_faster,
+        'time_regression': time_regression,
+        'baseline_length': base_length,
+        'current_length': current_length,
+        'length_ratio': length_ratio,
+        'length_regression': length_regression
+    }
+
+
+class BenchmarkComparison:
+    DEFAULT_COMPARE = {
+        'baseline': None,
+        'update_baseline': False,
+        'repeats': 10,
+        'warmup': 1,
+        'alpha': 0.01,
+        'time_tolerance': 0.05,
+        'length_tolerance': 1e-6,
+        'confidence': 0.95,
+        'bootstrap_samples': 2000
+    }
+
+    def __init__(self, benchmark, compare_config: Optional[Dict] = None):
+        self.benchmark = benchmark
+        self.compare_config = {**self.DEFAULT_COMPARE, **(compare_config or {})}
+        if not self.compare_config['baseline']:
+            raise ValueError("Comparison requires a 'baseline' path")
+        repeats, alpha = self.compare_config['repeats'], self.compare_config['alpha']
+        if repeats < 1 or min_p_value(repeats) >= alpha:
+            needed = next(r for r in range(1, 64) if min_p_value(r) < alpha)
+            raise ValueError(f"repeats={repeats} can never reach alpha={alpha}: the smallest Mann-Whitney "
+                             f"p-value is {min_p_value(max(repeats, 1)):.3g}; use at least {needed} repeats")
+
+    def run(self) -> Dict:
+        cfg = self.compare_config
+        path = cfg['baseline']
+        benchmark_config = self.benchmark.benchmark_config
+
+        if cfg['update_baseline'] or not os.path.exists(path):
+            samples = collect_samples(self.benchmark.derive({}), cfg['repeats'], cfg['warmup'])
+            save_baseline(path, benchmark_config, samples)
+            if benchmark_config['verbose']:
+                print(f"Baseline with {len(samples)} algorithm(s) written to {path}")
+            return {'baseline': path, 'recorded': True, 'algorithms': {}, 'regressions': [],
+                    'improvements': [], 'exit_code': 0}
+
+        baseline = load_baseline(path)
+        samples = collect_samples(self.benchmark.derive(baseline['config']), cfg['repeats'], cfg['warmup'])
+
+        algorithms = {}
+        for name, current in samples.items():
+            if name in baseline['algorithms']:
+                algorithms[name] = compare_algorithm(current, baseline['algorithms'][name], cfg)
+            else:
+                algorithms[name] = {'verdict': 'new', 'params_changed': False}
+        for name in baseline['algorithms']:
+            if name not in samples:
+                algorithms[name] = {'verdict': 'missing', 'params_changed': False}
+
+        regressions = [name for name, entry in algorithms.items() if entry['verdict'] in ('regression', 'error')]
+        report = {
+            'baseline': path,
+            'recorded': False,
+            'baseline_environment': baseline['environment'],
+            'algorithms': algorithms,
+            'regressions': regressions,
+            'improvements': [name for name, entry in algorithms.items() if entry['verdict'] == 'improvement'],
+            'exit_code': 1 if regressions else 0
+        }
+        if benchmark_config['verbose']:
+            self.print_report(report)
+        return report
+
+    def print_report(self, report: Dict):
+        green, red, reset = '\033[92m', '\033[91m', '\033[0m'
+        colors = {'regression': red, 'error': red, 'improvement': green}
+        rows: List[Tuple[str, ...]] = []
+        for name, entry in report['algorithms'].items():
+            if 'time_ratio' in entry:
+                low, high = entry['time_ratio_ci']
+                rows.append((
+                    name,
+                    f"{entry['baseline_time']:.4f}",
+                    f"{entry['current_time']:.4f}",
+                    f"{(entry['time_ratio'] - 1) * 100:+.1f}% [{(low - 1) * 100:+.1f}, {(high - 1) * 100:+.1f}]",
+                    f"{min(entry['p_slower'], entry['p_faster']):.4f}",
+                    f"{(entry['length_ratio'] - 1) * 100:+.3f}%",
+                    entry['verdict'] + (" (params changed)" if entry['params_changed'] else "")
+                ))
+            else:
+                rows.append((name, "-", "-", "-", "-", "-", entry['verdict']))
+
+        headers = ("Algorithm", "Base (s)", "Now (s)", "Time change [CI]", "p", "Length change", "Verdict")
+        widths = [max(len(header), *(len(row[i]) for row in rows)) if rows else len(header)
+                  for i, header in enumerate(headers)]
+        header = " | ".join(f"{h:<{w}}" for h, w in zip(headers, widths))
+
+        print("\n" + "=" * len(header))
+        print("REGRESSION CHECK".center(len(header)))
+        print("=" * len(header))
+        environment = report['baseline_environment']
+        print(f"Baseline: {report['baseline']} (NumPy {environment['numpy']}, Python {environment['python']})")
+        print(header)
+        print("-" * len(header))
+        for row in rows:
+            line = " | ".join(f"{cell:<{w}}" for cell, w in zip(row, widths))
+            color = colors.get(report['algorithms'][row[0]]['verdict'])
+            print(f"{color}{line}{reset}" if color else line)
+        print("=" * len(header))
+        if report['regressions']:
+            print(f"REGRESSIONS: {', '.join(report['regressions'])}")
+        else:
+            print("No regressions detected")
+        if report['improvements']:
+            print(f"Improvements: {', '.join(report['improvements'])}")
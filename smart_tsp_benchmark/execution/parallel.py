@@ -0,0 +1,171 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import os
+import signal
+import time
+import traceback
+from contextlib import nullcontext
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from smart_tsp_benchmark.calculators.tour import route_dtype
+from smart_tsp_benchmark.execution.shared import SharedArray
+from smart_tsp_benchmark.profiling.resources import limit_address_space
+
+
+def available_cores() -> List[int]:
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return []
+
+
+def pin_to_core(core: Optional[int]):
+    if core is not None and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {core})
+
+
+def _worker_main(conn, benchmark_cls, benchmark_config, config, points_descriptor, order_descriptor,
+                 route_descriptor, core, memory_limit):
+    pin_to_core(core)
+    if core is not None:
+        benchmark_config = {**benchmark_config, 'timing_core': core}
+    points = SharedArray.attach(points_descriptor)
+    order = SharedArray.attach(order_descriptor) if order_descriptor else None
+    route_buffer = SharedArray.attach(route_descriptor, writable=True)
+    try:
+        if memory_limit is not None:
+            limit_address_space(memory_limit)
+        benchmark = benchmark_cls(config=benchmark_config)
+        benchmark.points = points.array
+        benchmark.point_order = order.array if order else None
+        measurement = benchmark.time_algorithm(config)
+        if measurement['route'] is not None:
+            route_buffer.array[:] = measurement['route']
+            route_buffer.array.flush()
+            measurement['route'] = None
+            measurement['route_shared'] = True
+        conn.send(('ok', measurement))
+    except MemoryError:
+        conn.send(('oom', traceback.format_exc()))
+    except BaseException:
+        conn.send(('error', traceback.format_exc()))
+    finally:
+        points.close()
+        if order:
+            order.close()
+        route_buffer.close()
+        conn.close()
+
+
+class ParallelAlgorithmRunner:
+
+    def __init__(self, benchmark, workers: int, timeout: Optional[float] = None, pin_workers: bool = False,
+                 memory_limit_mb: Optional[float] = None):
+        self.benchmark = benchmark
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.pin_workers = pin_workers
+        self.memory_limit = int(memory_limit_mb * 1024 ** 2) if memory_limit_mb else None
+
+    def run(self, algorithms: Dict) -> Iterator[Tuple[str, Dict]]:
+        context = get_context()
+        pending = list(algorithms.items())
+        pin = self.pin_workers or self.benchmark.benchmark_config['precise_timing']
+        cores = available_cores() if pin else []
+        free_slots = list(range(self.workers))
+        running = {}
+        n_points = len(self.benchmark.points)
+
+        point_order = self.benchmark.point_order
+        with SharedArray.create(self.benchmark.points) as points, \
+                SharedArray.create(point_order) if point_order is not None else nullcontext() as order:
+            try:
+                while pending or running:
+                    while pending and free_slots:
+                        name, config = pending.pop(0)
+                        slot = free_slots.pop(0)
+                        core = cores[slot % len(cores)] if cores else None
+                        receiver, sender = context.Pipe(duplex=False)
+                        route_buffer = SharedArray.allocate((n_points,), route_dtype(n_points))
+                        process = context.Process(
+                            target=_worker_main,
+                            args=(sender, type(self.benchmark), self.benchmark.benchmark_config,
+                                  config, points.descriptor, order.descriptor if order else None,
+                                  route_buffer.descriptor, core, self.memory_limit),
+                            name=f"tsp-benchmark-{name}"
+                        )
+                        process.start()
+                        sender.close()
+                        running[receiver] = (name, process, time.perf_counter(), slot, route_buffer)
+
+                    for receiver in wait(list(running), timeout=self._wait_timeout(running)):
+                        name, process, started, slot, route_buffer = running.pop(receiver)
+                        yield name, self._receive(receiver, process, started, route_buffer)
+                        free_slots.append(slot)
+
+                    for receiver, (name, process, started, slot, route_buffer) in list(running.items()):
+                        if self._expired(started):
+                            del running[receiver]
+                            self._stop(receiver, process, route_buffer)
+                            free_slots.append(slot)
+                            yield name, {
+                                'status': 'timeout',
+                                'error': f"Exceeded {self.timeout} s time limit",
+                                'time': time.perf_counter() - started
+                            }
+            finally:
+                for receiver, (_, process, _, _, route_buffer) in running.items():
+                    self._stop(receiver, process, route_buffer)
+
+    def _wait_timeout(self, running) -> Optional[float]:
+        if self.timeout is None:
+            return None
+        now = time.perf_counter()
+        return max(0.0, min(entry[2] + self.timeout - now for entry in running.values()))
+
+    def _expired(self, started: float) -> bool:
+        return self.timeout is not None and time.perf_counter() - started >= self.timeout
+
+    def _receive(self, receiver, process, started: float, route_buffer: SharedArray) -> Dict:
+        try:
+            message = receiver.recv()
+        except EOFError:
+            message = None
+        finally:
+            receiver.close()
+        elapsed = time.perf_counter() - started
+        process.join()
+
+        route = np.asarray(route_buffer.array)
+        route_buffer.close()
+        if message is None:
+            return {'status': 'error', 'error': self._exit_reason(process.exitcode), 'time': elapsed}
+        if message[0] == 'oom':
+            limit = f" of {self.memory_limit // 1024 ** 2} MB" if self.memory_limit else ""
+            return {'status': 'oom', 'error': f"Exceeded memory limit{limit}\n{message[1]}", 'time': elapsed}
+        if message[0] == 'error':
+            return {'status': 'error', 'error': message[1], 'time': elapsed}
+
+        measurement = message[1]
+        if measurement.pop('route_shared', False):
+            measurement['route'] = route
+        return {'status': 'ok', 'measurement': measurement}
+
+    @staticmethod
+    def _exit_reason(exitcode: Optional[int]) -> str:
+        if exitcode is not None and exitcode < 0:
+            try:
+                return f"Worker killed by {signal.Signals(-exitcode).name}"
+            except ValueError:
+                pass
+        return f"Worker exited with code {exitcode}"
+
+    @staticmethod
+    def _stop(receiver, process, route_buffer: SharedArray):
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+        route_buffer.close()
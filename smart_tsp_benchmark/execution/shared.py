@@ -0,0 +1,79 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import mmap
+import os
+import tempfile
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+ArrayDescriptor = Tuple
+
+SHM_DIRECTORY = '/dev/shm'
+
+
+class SharedArray:
+
+    def __init__(self, array: np.ndarray, shm: Optional[shared_memory.SharedMemory] = None,
+                 owner: bool = False, path: Optional[str] = None):
+        self.array = array
+        self.shm = shm
+        self.owner = owner
+        self.path = path
+
+    @classmethod
+    def create(cls, source: np.ndarray) -> 'SharedArray':
+        if isinstance(source, np.memmap) and source.filename and isinstance(source.base, mmap.mmap):
+            return cls(source)
+
+        source = np.ascontiguousarray(source)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, source.nbytes))
+        array = np.ndarray(source.shape, dtype=source.dtype, buffer=shm.buf)
+        array[...] = source
+        return cls(array, shm, owner=True)
+
+    @classmethod
+    def allocate(cls, shape: Tuple[int, ...], dtype) -> 'SharedArray':
+        directory = SHM_DIRECTORY if os.path.isdir(SHM_DIRECTORY) else None
+        fd, path = tempfile.mkstemp(prefix='tsp-benchmark-', suffix='.bin', dir=directory)
+        try:
+            os.ftruncate(fd, max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize))
+        finally:
+            os.close(fd)
+        return cls(np.memmap(path, dtype=dtype, mode='r+', shape=shape), owner=True, path=path)
+
+    @classmethod
+    def attach(cls, descriptor: ArrayDescriptor, writable: bool = False) -> 'SharedArray':
+        kind, location, offset, shape, dtype = descriptor
+        if kind == 'file':
+            array = np.memmap(location, dtype=np.dtype(dtype), mode='r+' if writable else 'r',
+                              offset=offset, shape=shape)
+            return cls(array)
+
+        shm = shared_memory.SharedMemory(name=location)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        array.flags.writeable = writable
+        return cls(array, shm)
+
+    @property
+    def descriptor(self) -> ArrayDescriptor:
+        if self.shm is None:
+            return 'file', self.array.filename, self.array.offset, self.array.shape, self.array.dtype.str
+        return 'shm', self.shm.name, 0, self.array.shape, self.array.dtype.str
+
+    def close(self):
+        self.array = None
+        if self.path is not None and self.owner:
+            os.unlink(self.path)
+            self.path = None
+        if self.shm is None:
+            return
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
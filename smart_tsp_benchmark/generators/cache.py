@@ -0,0 +1,152 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import hashlib
+import json
+import os
+import tempfile
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from smart_tsp_benchmark.generators.points import GENERATOR_VERSION, generate_points
+
+
+VERIFY_MODES = ('header', 'checksum')
+
+
+class InstanceCacheError(ValueError):
+    pass
+
+
+def _checksum(array: np.ndarray) -> str:
+    digest = hashlib.sha256()
+    flat = np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+    chunk = 1 << 24
+    for start in range(0, len(flat), chunk):
+        digest.update(flat[start:start + chunk])
+    return digest.hexdigest()
+
+
+class InstanceCache:
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None, verify: str = 'header'):
+        if verify not in VERIFY_MODES:
+            raise ValueError(f"Unknown cache verification mode: {verify}")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.verify = verify
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(method: str, n: int, seed: int, scale: float, noise: float, dtype=np.float64) -> Dict:
+        return {
+            'method': method,
+            'n': int(n),
+            'seed': int(seed),
+            'scale': float(scale),
+            'noise': float(noise),
+            'dtype': np.dtype(dtype).str,
+            'version': GENERATOR_VERSION
+        }
+
+    def path_for(self, key: Dict) -> str:
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+        return os.path.join(self.directory, f"{key['method']}-{key['n']}-{key['seed']}-{digest}.npy")
+
+    def load(self, key: Dict) -> Optional[np.ndarray]:
+        path = self.path_for(key)
+        meta_path = path + '.json'
+        if not (os.path.exists(path) and os.path.exists(meta_path)):
+            return None
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            points = np.load(path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            self.discard(path)
+            raise InstanceCacheError(f"Corrupted cache entry {path}: {e}") from e
+
+        if (meta.get('key') != key or tuple(meta.get('shape', ())) != points.shape
+                or meta.get('dtype') != points.dtype.str
+                or os.path.getsize(path) != points.offset + points.nbytes
+                or (self.verify == 'checksum' and meta.get('sha256') != _checksum(points))):
+            del points
+            self.discard(path)
+            raise InstanceCacheError(f"Integrity check failed for cache entry {path}")
+
+        os.utime(path)
+        return points
+
+    def store(self, key: Dict, fill: Callable[[np.ndarray], None]) -> np.ndarray:
+        path = self.path_for(key)
+        shape = (key['n'], 2)
+
+        fd, data_path = tempfile.mkstemp(dir=self.directory, suffix='.npy.tmp')
+        os.close(fd)
+        fd, meta_path = tempfile.mkstemp(dir=self.directory, suffix='.json.tmp')
+        try:
+            points = np.lib.format.open_memmap(data_path, mode='w+', dtype=np.dtype(key['dtype']), shape=shape)
+            fill(points)
+            points.flush()
+            meta = {
+                'key': key,
+                'shape': list(shape),
+                'dtype': points.dtype.str,
+                'sha256': _checksum(points)
+            }
+            del points
+            with os.fdopen(fd, 'w') as f:
+                json.dump(meta, f)
+            os.replace(data_path, path)
+            os.replace(meta_path, path + '.json')
+        except BaseException:
+            for tmp_path in (data_path, meta_path):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            raise
+
+        self.evict(keep=path)
+        return np.load(path, mmap_mode='r')
+
+    def get_or_generate(self, method: str, n: int, seed: int,
+                        scale: float = 100.0, noise: float = 5.0, dtype=np.float64) -> np.ndarray:
+        key = self.make_key(method, n, seed, scale, noise, dtype)
+        try:
+            points = self.load(key)
+        except InstanceCacheError:
+            points = None
+        if points is None:
+            points = self.store(key, lambda out: generate_points(n, seed, method=method, scale=scale,
+                                                                 noise=noise, out=out))
+        return points
+
+    def entries(self):
+        for name in os.listdir(self.directory):
+            if name.endswith('.npy'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def evict(self, keep: Optional[str] = None):
+        if self.max_bytes is None:
+            return
+        entries = sorted(self.entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self.discard(path)
+            total -= size
+
+    @staticmethod
+    def discard(path: str):
+        for target in (path, path + '.json'):
+            try:
+                os.remove(target)
+            except FileNotFoundError:
+                pass
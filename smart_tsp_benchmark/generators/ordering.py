@@ -0,0 +1,59 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import numpy as np
+
+from smart_tsp_benchmark.calculators.tour import route_dtype
+
+CURVE_BITS = 16
+POINT_ORDERS = ('hilbert', 'morton', 'shuffle')
+
+
+def _grid_coordinates(points: np.ndarray, bits: int):
+    points = np.asarray(points, dtype=np.float64)
+    low = points.min(axis=0)
+    span = np.maximum(points.max(axis=0) - low, np.finfo(np.float64).tiny)
+    cells = (points - low) / span * ((1 << bits) - 1)
+    grid = np.rint(cells).astype(np.uint64)
+    return grid[:, 0], grid[:, 1]
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    values = values & np.uint64(0xFFFFFFFF)
+    for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF),
+                        (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333), (1, 0x5555555555555555)):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def morton_keys(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return _spread_bits(x) | (_spread_bits(y) << np.uint64(1))
+
+
+def hilbert_keys(x: np.ndarray, y: np.ndarray, bits: int = CURVE_BITS) -> np.ndarray:
+    x = x.astype(np.uint64)
+    y = y.astype(np.uint64)
+    full = np.uint64((1 << bits) - 1)
+    keys = np.zeros(len(x), dtype=np.uint64)
+    for level in range(bits - 1, -1, -1):
+        s = np.uint64(1 << level)
+        rx = (x & s) != 0
+        ry = (y & s) != 0
+        keys += s * s * ((3 * rx.astype(np.uint64)) ^ ry.astype(np.uint64))
+        flip = rx & ~ry
+        x = np.where(flip, x ^ full, x)
+        y = np.where(flip, y ^ full, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+    return keys
+
+
+def spatial_order(points: np.ndarray, method: str = 'hilbert', seed: int = 0,
+                  bits: int = CURVE_BITS) -> np.ndarray:
+    if method not in POINT_ORDERS:
+        raise ValueError(f"Unknown point order: {method}")
+
+    n = len(points)
+    if method == 'shuffle':
+        return np.random.default_rng(seed).permutation(n).astype(route_dtype(n))
+
+    x, y = _grid_coordinates(points, bits)
+    keys = hilbert_keys(x, y, bits) if method == 'hilbert' else morton_keys(x, y)
+    return np.argsort(keys, kind='stable').astype(route_dtype(n))
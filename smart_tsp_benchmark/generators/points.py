@@ -1,53 +1,77 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from typing import Iterator, Optional, Tuple
+
 import numpy as np
 
+GENERATOR_VERSION = 2
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _chunks(start: int, stop: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    for chunk_start in range(start, stop, chunk_size):
+        yield chunk_start, min(stop, chunk_start + chunk_size)
+
 
 class RandomPointGenerator:
     @classmethod
-    def generate(cls, n, scale):
-        return np.random.rand(n, 2) * scale
+    def generate(cls, out, rng, scale, noise, chunk_size):
+        for start, stop in _chunks(0, len(out), chunk_size):
+            out[start:stop] = rng.random((stop - start, 2)) * scale
 
 
 class ClusterPointGenerator:
     @classmethod
-    def generate(cls, n, scale):
-        clusters = np.random.randint(3, 7)
-        sizes = np.random.multinomial(n, np.ones(clusters) / clusters)
-        return np.concatenate([
-            np.random.randn(size, 2) * (scale / 10) + np.random.rand(2) * scale * 0.8
-            for size in sizes
-        ])
+    def generate(cls, out, rng, scale, noise, chunk_size):
+        clusters = rng.integers(3, 7)
+        sizes = rng.multinomial(len(out), np.ones(clusters) / clusters)
+        centers = rng.random((clusters, 2)) * scale * 0.8
+        offset = 0
+        for center, size in zip(centers, sizes):
+            for start, stop in _chunks(offset, offset + size, chunk_size):
+                out[start:stop] = rng.standard_normal((stop - start, 2)) * (scale / 10) + center
+            offset += size
 
 
 class CirclePointGenerator:
     @classmethod
-    def generate(cls, n, scale, noise):
-        angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
-        base = scale / 2 + (scale / 3) * np.column_stack([np.cos(angles), np.sin(angles)])
-        return base + np.random.randn(n, 2) * noise
+    def generate(cls, out, rng, scale, noise, chunk_size):
+        n = len(out)
+        for start, stop in _chunks(0, n, chunk_size):
+            angles = 2 * np.pi * np.arange(start, stop) / n
+            base = scale / 2 + (scale / 3) * np.column_stack([np.cos(angles), np.sin(angles)])
+            out[start:stop] = base + rng.standard_normal((stop - start, 2)) * noise
 
 
 class GridPointGenerator:
     @classmethod
-    def generate(cls, n, scale, noise):
-        grid_size = int(np.sqrt(n)) + 1
-        x = np.linspace(0, scale, grid_size)
-        y = np.linspace(0, scale, grid_size)
-        xx, yy = np.meshgrid(x, y)
-        points = np.column_stack([xx.ravel(), yy.ravel()])
-        return points[:n] + np.random.randn(n, 2) * noise
+    def generate(cls, out, rng, scale, noise, chunk_size):
+        grid_size = int(np.sqrt(len(out))) + 1
+        axis = np.linspace(0, scale, grid_size)
+        for start, stop in _chunks(0, len(out), chunk_size):
+            index = np.arange(start, stop)
+            base = np.column_stack([axis[index % grid_size], axis[index // grid_size]])
+            out[start:stop] = base + rng.standard_normal((stop - start, 2)) * noise
 
 
 class SpiralPointGenerator:
     @classmethod
-    def generate(cls, n, scale, noise):
-        t = np.linspace(0, 10 * np.pi, n)
-        r = t / t.max() * scale / 2
-        x = scale / 2 + r * np.cos(t)
-        y = scale / 2 + r * np.sin(t)
-        return np.column_stack([x, y]) + np.random.randn(n, 2) * noise
+    def generate(cls, out, rng, scale, noise, chunk_size):
+        n = len(out)
+        for start, stop in _chunks(0, n, chunk_size):
+            fraction = np.arange(start, stop) / max(n - 1, 1)
+            t = 10 * np.pi * fraction
+            r = fraction * scale / 2
+            base = np.column_stack([scale / 2 + r * np.cos(t), scale / 2 + r * np.sin(t)])
+            out[start:stop] = base + rng.standard_normal((stop - start, 2)) * noise
 
 
+GENERATORS = {
+    'random': RandomPointGenerator,
+    'cluster': ClusterPointGenerator,
+    'circle': CirclePointGenerator,
+    'grid': GridPointGenerator,
+    'spiral': SpiralPointGenerator,
+}
 
 
 def generate_points(
@@ -55,27 +79,25 @@ def generate_points(
         seed: int = 42,
         method = 'random',
         scale: float = 100.0,
-        noise: float = 5.0
+        noise: float = 5.0,
+        dtype=np.float64,
+        out: Optional[np.ndarray] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        rng: Optional[np.random.Generator] = None
 ) -> np.ndarray:
-    np.random.seed(seed)
-
-    if method == 'random':
-        return RandomPointGenerator.generate(n, scale)
-
-    elif method == 'cluster':
-        return ClusterPointGenerator.generate(n, scale)
-
-    elif method == 'circle':
-        return CirclePointGenerator.generate(n, scale, noise)
+    if method not in GENERATORS:
+        raise ValueError(f"Unknown method: {method}")
 
-    elif method == 'grid':
-        return GridPointGenerator.generate(n, scale, noise)
+    if out is None:
+        out = np.empty((n, 2), dtype=dtype)
+    elif out.shape != (n, 2):
+        raise ValueError(f"Output array must have shape {(n, 2)}, got {out.shape}")
 
-    elif method == 'spiral':
-        return SpiralPointGenerator.generate(n, scale, noise)
+    if rng is None:
+        rng = np.random.default_rng(seed)
 
-    else:
-        raise ValueError(f"Unknown method: {method}")
+    GENERATORS[method].generate(out, rng, scale, noise, max(1, chunk_size))
+    return out
 
 
 if __name__ == "__main__":
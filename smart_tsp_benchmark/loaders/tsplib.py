@@ -0,0 +1,87 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Optional, Tuple
+
+import numpy as np
+
+COORD_SECTIONS = (b'NODE_COORD_SECTION', b'DISPLAY_DATA_SECTION')
+SUPPORTED_EDGE_WEIGHT_TYPES = ('EUC_2D', 'CEIL_2D', 'ATT', 'GEO', 'MAX_2D', 'MAN_2D')
+
+
+@dataclass
+class TSPLIBInstance:
+    name: str
+    points: np.ndarray
+    header: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def dimension(self) -> int:
+        return len(self.points)
+
+    @property
+    def edge_weight_type(self) -> Optional[str]:
+        return self.header.get('EDGE_WEIGHT_TYPE')
+
+
+def _read_header(f: BinaryIO, sections) -> Tuple[Dict[str, str], Optional[bytes]]:
+    header = {}
+    for raw in f:
+        line = raw.strip()
+        if not line:
+            continue
+        keyword = line.split(b':', 1)[0].strip()
+        if keyword in sections:
+            return header, keyword
+        if keyword == b'EOF':
+            break
+        if b':' in line:
+            key, value = line.split(b':', 1)
+            header[key.strip().decode()] = value.strip().decode()
+    return header, None
+
+
+def _read_numbers(f: BinaryIO, count: int, dtype) -> np.ndarray:
+    values = np.fromfile(f, dtype=dtype, count=count, sep=' ')
+    if len(values) != count:
+        raise ValueError(f"Expected {count} values, found {len(values)}")
+    return values
+
+
+def read_tsplib(path: str, dtype=np.float64) -> TSPLIBInstance:
+    with open(path, 'rb') as f:
+        header, section = _read_header(f, COORD_SECTIONS)
+        if header.get('TYPE', 'TSP').split()[0] != 'TSP':
+            raise ValueError(f"Unsupported TSPLIB type: {header['TYPE']}")
+        edge_weight_type = header.get('EDGE_WEIGHT_TYPE')
+        if section is None:
+            raise ValueError(f"No coordinate section in {path} (EDGE_WEIGHT_TYPE={edge_weight_type})")
+        if 'DIMENSION' not in header:
+            raise ValueError(f"Missing DIMENSION in {path}")
+        if edge_weight_type not in SUPPORTED_EDGE_WEIGHT_TYPES and section != b'DISPLAY_DATA_SECTION':
+            raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {edge_weight_type}")
+
+        n = int(header['DIMENSION'])
+        rows = _read_numbers(f, 3 * n, np.float64).reshape(n, 3)
+
+    ids = rows[:, 0].astype(np.int64)
+    points = np.empty((n, 2), dtype=dtype)
+    if np.array_equal(ids, np.arange(1, n + 1)):
+        points[...] = rows[:, 1:]
+    else:
+        if ids.min() < 1 or ids.max() > n or len(np.unique(ids)) != n:
+            raise ValueError(f"Node ids in {path} are not a permutation of 1..{n}")
+        points[ids - 1] = rows[:, 1:]
+
+    return TSPLIBInstance(header.get('NAME', ''), points, header)
+
+
+def read_tour(path: str) -> np.ndarray:
+    with open(path, 'rb') as f:
+        header, section = _read_header(f, (b'TOUR_SECTION',))
+        if section is None:
+            raise ValueError(f"No TOUR_SECTION in {path}")
+        if 'DIMENSION' in header:
+            tour = _read_numbers(f, int(header['DIMENSION']), np.int64)
+        else:
+            tour = np.array(f.read().split(b'-1', 1)[0].split(), dtype=np.int64)
+    return tour - 1
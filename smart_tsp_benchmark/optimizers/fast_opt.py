@@ -1,29 +1,43 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
-from typing import List
+from math import hypot
+from typing import List, Union
 
 import numpy as np
 
-from smart_tsp_benchmark.calculators.length import calculate_length
-from smart_tsp_benchmark.optimizers.two_opt import two_opt_swap
+from smart_tsp_benchmark.calculators.tour import route_dtype
+from smart_tsp_benchmark.optimizers.two_opt import two_opt_reverse
 
+WINDOW = 20
+IMPROVEMENT_EPS = 1e-10
 
-def fast_post_optimize(points: np.ndarray, route: List[int],
-                       max_iter: int = 50) -> List[int]:
-    best_route = route
-    best_length = calculate_length(points, route)
-    n = len(route)
+
+def fast_post_optimize(points: np.ndarray, route: Union[List[int], np.ndarray],
+                       max_iter: int = 50, window: int = WINDOW) -> Union[List[int], np.ndarray]:
+    best_route = np.array(route, dtype=route_dtype(len(points)))
+    xs = points[:, 0].tolist()
+    ys = points[:, 1].tolist()
+    n = len(best_route)
 
     for _ in range(max_iter):
         improved = False
         for i in range(1, n - 2):
-            for k in range(i + 1, min(n - 1, i + 20)):
-                if k - i < 2: continue
-                new_route = two_opt_swap(best_route, i, k)
-                new_length = calculate_length(points, new_route)
-                if new_length < best_length:
-                    best_route = new_route
-                    best_length = new_length
+            stop = min(n - 1, i + window)
+            if stop - i <= 2:
+                continue
+            segment = best_route[i - 1:stop + 1].tolist()
+            a, b = segment[0], segment[1]
+            ab = hypot(xs[a] - xs[b], ys[a] - ys[b])
+            for k in range(i + 2, stop):
+                c, d = segment[k - i + 1], segment[k - i + 2]
+                delta = (hypot(xs[a] - xs[c], ys[a] - ys[c]) + hypot(xs[b] - xs[d], ys[b] - ys[d])
+                         - ab - hypot(xs[c] - xs[d], ys[c] - ys[d]))
+                if delta < -IMPROVEMENT_EPS:
+                    two_opt_reverse(best_route, i, k)
+                    segment = best_route[i - 1:stop + 1].tolist()
+                    b = segment[1]
+                    ab = hypot(xs[a] - xs[b], ys[a] - ys[b])
                     improved = True
         if not improved:
             break
-    return best_route
+
+    return best_route.tolist() if isinstance(route, list) else best_route
@@ -0,0 +1,182 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from collections import deque
+from math import hypot
+from typing import List, Optional, Union
+
+import numpy as np
+
+from smart_tsp_benchmark.calculators.tour import route_dtype
+
+IMPROVEMENT_EPS = 1e-10
+MAX_SEGMENT = 3
+
+
+def build_neighbor_lists(points: np.ndarray, n_neighbors: int) -> np.ndarray:
+    from scipy.spatial import cKDTree
+
+    n = len(points)
+    k = min(n_neighbors, n - 1)
+    _, neighbors = cKDTree(points).query(points, k=k + 1)
+    neighbors = neighbors.reshape(n, k + 1)
+    is_self = neighbors == np.arange(n)[:, None]
+    is_self[~is_self.any(axis=1), -1] = True
+    return neighbors[~is_self].reshape(n, k)
+
+
+def neighbor_post_optimize(points: np.ndarray, route: Union[List[int], np.ndarray],
+                           n_neighbors: int = 8, closed: bool = False,
+                           max_moves: Optional[int] = None) -> Union[List[int], np.ndarray]:
+    tour = np.array(route, dtype=route_dtype(len(points)))
+    n = len(tour)
+    if n < 5:
+        return route
+
+    xs = points[:, 0].tolist()
+    ys = points[:, 1].tolist()
+    neighbors = build_neighbor_lists(points, n_neighbors).tolist()
+    pos = np.empty(n, dtype=tour.dtype)
+    pos[tour] = np.arange(n)
+
+    def dist(a, b):
+        return hypot(xs[a] - xs[b], ys[a] - ys[b])
+
+    def succ_pos(i):
+        if i + 1 < n:
+            return i + 1
+        return 0 if closed else -1
+
+    def pred_pos(i):
+        if i > 0:
+            return i - 1
+        return n - 1 if closed else -1
+
+    def reverse(i, j):
+        length = j - i + 1
+        if closed and 2 * length > n:
+            i, j, length = j + 1, i - 1 + n, n - length
+        if length < 2:
+            return
+        if j < n:
+            segment = tour[i:j + 1][::-1].copy()
+            tour[i:j + 1] = segment
+            pos[segment] = np.arange(i, j + 1)
+        else:
+            index = np.arange(i, j + 1) % n
+            segment = tour[index][::-1]
+            tour[index] = segment
+            pos[segment] = index
+
+    def try_two_opt(a):
+        i = int(pos[a])
+        for forward in (True, False):
+            b_pos = succ_pos(i) if forward else pred_pos(i)
+            if b_pos < 0:
+                continue
+            b = int(tour[b_pos])
+            d_ab = dist(a, b)
+            for c in neighbors[a]:
+                gain = d_ab - dist(a, c)
+                if gain <= IMPROVEMENT_EPS:
+                    break
+                if c == a or c == b:
+                    continue
+                j = int(pos[c])
+                d_pos = succ_pos(j) if forward else pred_pos(j)
+                d = int(tour[d_pos]) if d_pos >= 0 else -1
+                if d == a:
+                    continue
+                delta = -gain + (dist(b, d) - dist(c, d) if d >= 0 else 0.0)
+                if delta >= -IMPROVEMENT_EPS:
+                    continue
+                if forward and j > i:
+                    reverse(i + 1, j)
+                elif forward:
+                    reverse(j + 1, i)
+                elif j < i:
+                    reverse(j, i - 1)
+                else:
+                    reverse(i, j - 1)
+                return [x for x in (a, b, c, d) if x >= 0]
+        return None
+
+    def try_or_opt(a):
+        i = int(pos[a])
+        starts = set()
+        for length in range(1, MAX_SEGMENT + 1):
+            starts.add((i, length))
+            starts.add((i - length + 1, length))
+
+        for start, length in sorted(starts):
+            end = start + length - 1
+            if start < 0 or end >= n or n - length < 3:
+                continue
+            s_first, s_last = int(tour[start]), int(tour[end])
+            p_pos, q_pos = pred_pos(start), succ_pos(end)
+            p = int(tour[p_pos]) if p_pos >= 0 else -1
+            q = int(tour[q_pos]) if q_pos >= 0 else -1
+            removal_gain = ((dist(p, s_first) if p >= 0 else 0.0) + (dist(s_last, q) if q >= 0 else 0.0)
+                            - (dist(p, q) if p >= 0 and q >= 0 else 0.0))
+            if removal_gain <= IMPROVEMENT_EPS:
+                continue
+
+            best = None
+            for c in set(neighbors[s_first]) | set(neighbors[s_last]):
+                if c == s_first or c == s_last:
+                    continue
+                j = int(pos[c])
+                if start <= j <= end:
+                    continue
+                for e_pos in (succ_pos(j), pred_pos(j)):
+                    if start <= e_pos <= end:
+                        continue
+                    e = int(tour[e_pos]) if e_pos >= 0 else -1
+                    for x, y in ((s_first, s_last), (s_last, s_first)):
+                        added = dist(c, x)
+                        if e >= 0:
+                            added += dist(y, e) - dist(c, e)
+                        delta = added - removal_gain
+                        if delta < -IMPROVEMENT_EPS and (best is None or delta < best[0]):
+                            best = (delta, c, j, e, e_pos, x)
+            if best is None:
+                continue
+
+            _, c, j, e, e_pos, x = best
+            if e_pos < 0:
+                gap = 0 if j == 0 else n
+            elif abs(j - e_pos) == 1:
+                gap = max(j, e_pos)
+            else:
+                gap = 0
+            c_is_left = j == gap - 1 or (gap == 0 and j == n - 1 and e_pos >= 0)
+            segment = tour[start:end + 1].copy()
+            if (x == s_first) != c_is_left:
+                segment = segment[::-1]
+
+            if gap <= start:
+                lo, hi = gap, end + 1
+                block = np.concatenate([segment, tour[gap:start]])
+            else:
+                lo, hi = start, gap
+                block = np.concatenate([tour[end + 1:gap], segment])
+            tour[lo:hi] = block
+            pos[block] = np.arange(lo, hi)
+
+            return [x for x in (s_first, s_last, p, q, c, e) if x >= 0]
+        return None
+
+    queue = deque(tour.tolist())
+    queued = [True] * n
+    moves = 0
+    while queue and (max_moves is None or moves < max_moves):
+        a = queue.popleft()
+        queued[a] = False
+        touched = try_two_opt(a) or try_or_opt(a)
+        if not touched:
+            continue
+        moves += 1
+        for city in touched:
+            if not queued[city]:
+                queued[city] = True
+                queue.append(city)
+
+    return tour.tolist() if isinstance(route, list) else tour
@@ -1,6 +1,12 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
 from typing import List
 
+import numpy as np
+
 
 def two_opt_swap(route: List[int], i: int, k: int) -> List[int]:
     return route[:i] + route[i:k + 1][::-1] + route[k + 1:]
+
+
+def two_opt_reverse(route: np.ndarray, i: int, k: int) -> None:
+    route[i:k + 1] = route[i:k + 1][::-1]
@@ -0,0 +1,92 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Sequence, Tuple
+
+
+@dataclass
+class PipelineNode:
+    key: Hashable
+    action: Callable[[], None]
+    requires: Tuple[Hashable, ...] = ()
+    exclusive: bool = False
+    dependents: List[Hashable] = field(default_factory=list)
+
+
+def step_name(step) -> str:
+    return step.name or type(step).__name__
+
+
+def step_requires(steps: Sequence, index: int) -> Tuple[str, ...]:
+    step = steps[index]
+    if step.requires is not None:
+        return tuple(step.requires)
+    return (step_name(steps[index - 1]),) if index > 0 else ()
+
+
+def topological_order(nodes: Dict[Hashable, PipelineNode]) -> List[Hashable]:
+    for node in nodes.values():
+        node.dependents.clear()
+    for node in nodes.values():
+        for dependency in node.requires:
+            if dependency not in nodes:
+                raise ValueError(f"Pipeline step {node.key!r} requires unknown step {dependency!r}")
+            nodes[dependency].dependents.append(node.key)
+
+    waiting = {key: len(node.requires) for key, node in nodes.items()}
+    ready = [key for key, count in waiting.items() if count == 0]
+    order = []
+    while ready:
+        key = ready.pop(0)
+        order.append(key)
+        for dependent in nodes[key].dependents:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                ready.append(dependent)
+    if len(order) != len(nodes):
+        cycle = sorted(str(key) for key, count in waiting.items() if count > 0)
+        raise ValueError(f"Pipeline has a dependency cycle between: {', '.join(cycle)}")
+    return order
+
+
+def run_pipeline(nodes: Dict[Hashable, PipelineNode], workers: int = 1):
+    order = topological_order(nodes)
+    if workers <= 1:
+        for key in order:
+            nodes[key].action()
+        return
+
+    rank = {key: index for index, key in enumerate(order)}
+    waiting = {key: len(nodes[key].requires) for key in order}
+    ready = [key for key in order if waiting[key] == 0]
+    running = {}
+
+    def complete(key):
+        for dependent in nodes[key].dependents:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                ready.append(dependent)
+        ready.sort(key=rank.get)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tsp-pipeline') as executor:
+        try:
+            while ready or running:
+                exclusive = next((key for key in ready if nodes[key].exclusive), None)
+                if exclusive is not None and not running:
+                    ready.remove(exclusive)
+                    nodes[exclusive].action()
+                    complete(exclusive)
+                    continue
+                if exclusive is None:
+                    while ready:
+                        key = ready.pop(0)
+                        running[executor.submit(nodes[key].action)] = key
+                if running:
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in sorted(done, key=lambda f: rank[running[f]]):
+                        key = running.pop(future)
+                        future.result()
+                        complete(key)
+        finally:
+            for future in running:
+                future.cancel()
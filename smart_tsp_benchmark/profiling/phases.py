@@ -0,0 +1,65 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import threading
+import time
+from typing import Dict, Optional
+
+_state = threading.local()
+
+
+def active_recorder() -> Optional['PhaseRecorder']:
+    return getattr(_state, 'recorder', None)
+
+
+class PhaseRecorder:
+
+    def __init__(self):
+        self.phases: Dict[str, Dict] = {}
+        self.stack = []
+        self._previous = None
+
+    def add(self, name: str, elapsed: float):
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = {'time': elapsed, 'calls': 1}
+        else:
+            entry['time'] += elapsed
+            entry['calls'] += 1
+
+    def __enter__(self):
+        self._previous = active_recorder()
+        _state.recorder = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _state.recorder = self._previous
+        return False
+
+
+class phase:
+    __slots__ = ('name', 'recorder', 'started')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.recorder = None
+        self.started = 0.0
+
+    def __enter__(self):
+        self.recorder = active_recorder()
+        if self.recorder is not None:
+            self.recorder.stack.append(self.name)
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.recorder is not None:
+            elapsed = time.perf_counter() - self.started
+            path = "/".join(self.recorder.stack)
+            self.recorder.stack.pop()
+            self.recorder.add(path, elapsed)
+        return False
+
+
+def record_phase(name: str, elapsed: float):
+    recorder = active_recorder()
+    if recorder is not None:
+        recorder.add("/".join(recorder.stack + [name]), elapsed)
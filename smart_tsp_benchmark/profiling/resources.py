@@ -0,0 +1,125 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import gc
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PROC_STATUS = '/proc/self/status'
+PROC_CLEAR_REFS = '/proc/self/clear_refs'
+
+
+def _read_status() -> Dict[str, int]:
+    values = {}
+    try:
+        with open(PROC_STATUS) as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('VmSize', 'VmRSS', 'VmHWM', 'Threads'):
+                    values[key] = int(value.split()[0])
+    except OSError:
+        pass
+    return values
+
+
+def _reset_peak_rss() -> bool:
+    try:
+        with open(PROC_CLEAR_REFS, 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _max_rss_kb() -> int:
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss // 1024 if sys.platform == 'darwin' else max_rss
+
+
+def limit_address_space(headroom_bytes: int):
+    if resource is None:
+        raise OSError("Memory limits require the resource module")
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = _read_status().get('VmSize', 0) * 1024 + headroom_bytes
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _gc_collections():
+    return [stats['collections'] for stats in gc.get_stats()]
+
+
+class ResourceProbe:
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.metrics: Dict = {}
+        self.overhead = 0.0
+
+    def __enter__(self):
+        started = time.perf_counter()
+        self._peak_reset = _reset_peak_rss()
+        status = _read_status()
+        self._rss_before = status.get('VmRSS', _max_rss_kb())
+        self._hwm_before = status.get('VmHWM', _max_rss_kb())
+        self._threads_before = status.get('Threads', threading.active_count())
+        self._gc_before = _gc_collections()
+        self._times_before = os.times()
+        self._started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        self.overhead = time.perf_counter() - started
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        started = time.perf_counter()
+        times = os.times()
+        traced_peak: Optional[int] = None
+        if self.trace_memory:
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+        status = _read_status()
+        gc_after = _gc_collections()
+
+        peak = status.get('VmHWM', _max_rss_kb())
+        baseline = self._rss_before if self._peak_reset else self._hwm_before
+        self.metrics = {
+            'peak_rss_delta_kb': max(0, peak - baseline),
+            'tracemalloc_peak_kb': traced_peak // 1024 if traced_peak is not None else None,
+            'cpu_user': times.user - self._times_before.user,
+            'cpu_sys': times.system - self._times_before.system,
+            'gc_collections': [after - before for after, before in zip(gc_after, self._gc_before)],
+            'threads': max(self._threads_before, status.get('Threads', threading.active_count()))
+        }
+        self.overhead += time.perf_counter() - started
+        self.metrics['overhead'] = self.overhead
+        return False
+
+
+def merge_metrics(*metrics: Dict) -> Dict:
+    metrics = [m for m in metrics if m]
+    if not metrics:
+        return {}
+    traced = [m['tracemalloc_peak_kb'] for m in metrics if m['tracemalloc_peak_kb'] is not None]
+    return {
+        'peak_rss_delta_kb': max(m['peak_rss_delta_kb'] for m in metrics),
+        'tracemalloc_peak_kb': max(traced) if traced else None,
+        'cpu_user': sum(m['cpu_user'] for m in metrics),
+        'cpu_sys': sum(m['cpu_sys'] for m in metrics),
+        'gc_collections': [sum(gen) for gen in zip(*(m['gc_collections'] for m in metrics))],
+        'threads': max(m['threads'] for m in metrics),
+        'overhead': sum(m['overhead'] for m in metrics)
+    }
@@ -0,0 +1,78 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import gc
+import math
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Optional, Tuple
+
+CALIBRATION_SAMPLES = 10_000
+
+_timer_overhead: Optional[float] = None
+
+
+def timer_overhead() -> float:
+    global _timer_overhead
+    if _timer_overhead is None:
+        counter = time.perf_counter
+        deltas = []
+        for _ in range(CALIBRATION_SAMPLES):
+            start = counter()
+            deltas.append(counter() - start)
+        deltas.sort()
+        _timer_overhead = deltas[len(deltas) // 2]
+    return _timer_overhead
+
+
+@contextmanager
+def gc_paused(enabled: bool = True):
+    if not enabled or not gc.isenabled():
+        yield
+        return
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+@contextmanager
+def pinned_to_core(core: Optional[int]):
+    if not hasattr(os, 'sched_setaffinity'):
+        yield None
+        return
+    previous = os.sched_getaffinity(0)
+    if core is None:
+        if len(previous) == 1:
+            yield next(iter(previous))
+            return
+        core = min(previous)
+    if core not in previous:
+        raise ValueError(f"Timing core {core} is not available, allowed cores: {sorted(previous)}")
+    os.sched_setaffinity(0, {core})
+    try:
+        yield core
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def measure_loops(func: Callable[[], Any], loops: int, pause_gc: bool = True) -> Tuple[Any, float]:
+    counter = time.perf_counter
+    result = None
+    with gc_paused(pause_gc):
+        start = counter()
+        for _ in range(loops):
+            result = func()
+        elapsed = counter() - start
+    return result, max(0.0, elapsed - timer_overhead()) / loops
+
+
+def refine_timing(func: Callable[[], Any], elapsed: float, min_time: float, max_loops: int,
+                  repeats: int = 3, pause_gc: bool = True) -> Tuple[float, int]:
+    elapsed = max(0.0, elapsed - timer_overhead())
+    if elapsed >= min_time or max_loops <= 1:
+        return elapsed, 1
+    loops = min(max_loops, math.ceil(min_time / max(elapsed, timer_overhead(), 1e-9)))
+    best = min(measure_loops(func, loops, pause_gc)[1] for _ in range(max(1, repeats)))
+    return best, loops
@@ -0,0 +1,234 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import csv
+import json
+import os
+import platform
+import re
+import socket
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from smart_tsp_benchmark.calculators.tour import as_route
+
+FIELDS = [
+    ('run_id', 'str'),
+    ('timestamp', 'float'),
+    ('algorithm', 'str'),
+    ('status', 'str'),
+    ('error', 'str'),
+    ('n_points', 'int'),
+    ('seed', 'int'),
+    ('point_generation', 'str'),
+    ('instance', 'str'),
+    ('time', 'float'),
+    ('solve_time', 'float'),
+    ('post_opt_time', 'float'),
+    ('eval_time', 'float'),
+    ('loops', 'int'),
+    ('post_opt_loops', 'int'),
+    ('timer_overhead', 'float'),
+    ('length', 'float'),
+    ('gap', 'float'),
+    ('peak_rss_delta_kb', 'int'),
+    ('tracemalloc_peak_kb', 'int'),
+    ('cpu_user', 'float'),
+    ('cpu_sys', 'float'),
+    ('params', 'str'),
+    ('phases', 'str'),
+    ('route_file', 'str'),
+    ('config', 'str'),
+    ('environment', 'str'),
+]
+
+RESOURCE_FIELDS = ('peak_rss_delta_kb', 'tracemalloc_peak_kb', 'cpu_user', 'cpu_sys')
+SWEEP_METRICS = ('time', 'solve_time', 'post_opt_time', 'eval_time', 'length')
+SWEEP_STATS = ('median', 'p95', 'min', 'std', 'mean')
+SWEEP_CELL_FIELDS = [
+    ('run_id', 'str'),
+    ('timestamp', 'float'),
+    ('point_generation', 'str'),
+    ('n_points', 'int'),
+    ('seed', 'int'),
+    ('algorithm', 'str'),
+    ('params', 'str'),
+    ('status', 'str'),
+    ('error', 'str'),
+]
+SWEEP_FIELDS = SWEEP_CELL_FIELDS + [(f"{metric}_{stat}", 'float') for metric in SWEEP_METRICS for stat in SWEEP_STATS]
+PARQUET_BATCH = 256
+
+
+def collect_environment() -> Dict:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'hostname': socket.gethostname(),
+        'cpu_count': os.cpu_count(),
+        'argv': sys.argv
+    }
+
+
+def _to_json(value) -> str:
+    return json.dumps(value, default=str, sort_keys=True)
+
+
+def _slug(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_')
+
+
+def save_route(path: str, route) -> str:
+    np.save(path, as_route(route))
+    return path
+
+
+class JsonlSink:
+
+    def __init__(self, path: str, fields=None, flatten_record=None):
+        self.file = open(path, 'a')
+
+    def write(self, record: Dict):
+        self.file.write(json.dumps(record, default=str) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class CsvSink:
+
+    def __init__(self, path: str, fields=None, flatten_record=None):
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.flatten = flatten_record or flatten
+        self.file = open(path, 'a', newline='')
+        self.writer = csv.DictWriter(self.file, fieldnames=[name for name, _ in fields or FIELDS],
+                                     extrasaction='ignore')
+        if new_file:
+            self.writer.writeheader()
+
+    def write(self, record: Dict):
+        self.writer.writerow({key: '' if value is None else value for key, value in self.flatten(record).items()})
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink:
+
+    def __init__(self, path: str, fields=None, flatten_record=None):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet output requires pyarrow: pip install pyarrow") from e
+
+        types = {'str': pa.string(), 'float': pa.float64(), 'int': pa.int64()}
+        self.pa = pa
+        self.flatten = flatten_record or flatten
+        self.schema = pa.schema([(name, types[kind]) for name, kind in fields or FIELDS])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.buffer: List[Dict] = []
+
+    def write(self, record: Dict):
+        self.buffer.append(self.flatten(record))
+        if len(self.buffer) >= PARQUET_BATCH:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.writer.write_table(self.pa.Table.from_pylist(self.buffer, schema=self.schema))
+            self.buffer = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+SINKS = {
+    'jsonl': JsonlSink,
+    'csv': CsvSink,
+    'parquet': ParquetSink,
+}
+
+
+def flatten(record: Dict) -> Dict:
+    usage = (record.get('resources') or {}).get('total') or {}
+    row = {name: record.get(name) for name, _ in FIELDS}
+    for name in RESOURCE_FIELDS:
+        row[name] = usage.get(name)
+    for name in ('params', 'phases', 'config', 'environment'):
+        row[name] = _to_json(record.get(name)) if record.get(name) is not None else None
+    return row
+
+
+def flatten_sweep(record: Dict) -> Dict:
+    row = {name: record.get(name) for name, _ in SWEEP_CELL_FIELDS}
+    for metric in SWEEP_METRICS:
+        stats = record.get(metric) or {}
+        for stat in SWEEP_STATS:
+            row[f"{metric}_{stat}"] = stats.get(stat)
+    return row
+
+
+def new_run_id() -> str:
+    return time.strftime('%Y%m%d-%H%M%S') + '-' + uuid.uuid4().hex[:8]
+
+
+class ResultsWriter:
+
+    def __init__(self, directory: str, formats: Sequence[str], config: Dict, run_id: Optional[str] = None):
+        unknown = [fmt for fmt in formats if fmt not in SINKS]
+        if unknown:
+            raise ValueError(f"Unknown results format(s): {', '.join(unknown)}")
+
+        self.directory = directory
+        self.run_id = run_id or new_run_id()
+        self.route_dir = os.path.join(directory, 'routes', self.run_id)
+        os.makedirs(self.route_dir, exist_ok=True)
+
+        self.config = {key: value for key, value in config.items() if key != 'sweep'}
+        self.environment = collect_environment()
+        self.sinks = [SINKS[fmt](os.path.join(directory, self.file_name(fmt))) for fmt in formats]
+
+    def file_name(self, fmt: str) -> str:
+        if fmt == 'parquet':
+            return f"results-{self.run_id}.parquet"
+        return f"results.{fmt}"
+
+    def build_record(self, name: str, result: Dict) -> Dict:
+        route_file = None
+        if result.get('route') is not None:
+            route_file = save_route(os.path.join(self.route_dir, _slug(name) + '.npy'), result['route'])
+
+        record = {key: value for key, value in result.items() if key not in ('route', 'points')}
+        record.update({
+            'run_id': self.run_id,
+            'timestamp': time.time(),
+            'algorithm': name,
+            'n_points': result.get('points'),
+            'seed': self.config.get('seed'),
+            'point_generation': self.config.get('point_generation'),
+            'instance': self.config.get('instance'),
+            'route_file': route_file,
+            'config': self.config,
+            'environment': self.environment
+        })
+        return record
+
+    def write(self, name: str, result: Dict) -> Dict:
+        record = self.build_record(name, result)
+        for sink in self.sinks:
+            sink.write(record)
+        return record
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
@@ -0,0 +1,199 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import math
+import sys
+import traceback
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+def size_ladder(start: int, stop: int, factor: float) -> List[int]:
+    if start < 2 or factor <= 1:
+        raise ValueError(f"Ladder needs start >= 2 and factor > 1, got start={start}, factor={factor}")
+    sizes = []
+    size = float(start)
+    while round(size) <= stop:
+        if not sizes or round(size) != sizes[-1]:
+            sizes.append(int(round(size)))
+        size *= factor
+    return sizes
+
+
+def fit_power_law(sizes: Sequence[float], values: Sequence[float], confidence: float = 0.95) -> Optional[Dict]:
+    sizes = np.asarray(sizes, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    mask = (sizes > 0) & (values > 0)
+    if np.count_nonzero(mask) < 2:
+        return None
+
+    x, y = np.log(sizes[mask]), np.log(values[mask])
+    (exponent, intercept), residuals, *_ = np.polyfit(x, y, 1, full=True)
+    fit = {'coefficient': float(np.exp(intercept)), 'exponent': float(exponent), 'points': len(x),
+           'r2': None, 'exponent_ci': None}
+
+    total = float(((y - y.mean()) ** 2).sum())
+    residual = float(residuals[0]) if len(residuals) else 0.0
+    if total > 0:
+        fit['r2'] = 1 - residual / total
+    if len(x) > 2:
+        from scipy.stats import t
+
+        stderr = math.sqrt(residual / (len(x) - 2) / float(((x - x.mean()) ** 2).sum()))
+        margin = float(t.ppf((1 + confidence) / 2, len(x) - 2)) * stderr
+        fit['exponent_ci'] = (fit['exponent'] - margin, fit['exponent'] + margin)
+    return fit
+
+
+def predict_value(fit: Dict, n: float) -> float:
+    return fit['coefficient'] * n ** fit['exponent']
+
+
+def predict_max_n(fit: Optional[Dict], budget: Optional[float]) -> Optional[float]:
+    if fit is None or budget is None:
+        return None
+    if fit['exponent'] <= 0:
+        return math.inf
+    log_n = math.log(budget / fit['coefficient']) / fit['exponent']
+    return math.exp(log_n) if log_n < math.log(sys.float_info.max) else math.inf
+
+
+class ScalingSuite:
+    DEFAULT_SCALING = {
+        'start': 1000,
+        'stop': 2_000_000,
+        'factor': 2.0,
+        'seed': 777,
+        'point_generation': 'random',
+        'repeats': 1,
+        'time_budget': 60.0,
+        'memory_budget_mb': None,
+        'overshoot': 4.0,
+        'confidence': 0.95,
+        'plot_output': None
+    }
+
+    def __init__(self, benchmark, scaling_config: Optional[Dict] = None):
+        self.benchmark = benchmark
+        self.scaling_config = {**self.DEFAULT_SCALING, **(scaling_config or {})}
+
+    def run(self) -> Dict[str, Dict]:
+        cfg = self.scaling_config
+        benchmark = self.benchmark.derive({'seed': cfg['seed'], 'point_generation': cfg['point_generation'],
+                                           'instance': None, 'profile_resources': True})
+        benchmark_config = benchmark.benchmark_config
+        algorithms = {name: config for name, config in benchmark.algorithms.items() if config.enabled}
+        curves = {name: {'sizes': [], 'times': [], 'memory_kb': [], 'stopped': None} for name in algorithms}
+
+        for n_points in size_ladder(cfg['start'], cfg['stop'], cfg['factor']):
+            active = {name: config for name, config in algorithms.items()
+                      if curves[name]['stopped'] is None and not self._skip(curves[name], n_points)}
+            if not active:
+                break
+            benchmark_config['n_points'] = n_points
+            benchmark.prepare_instance()
+            for name, config in active.items():
+                self._run_rung(benchmark, curves[name], config, n_points)
+                self._print_rung(name, curves[name], n_points)
+
+        memory_budget_kb = cfg['memory_budget_mb'] * 1024 if cfg['memory_budget_mb'] else None
+        for curve in curves.values():
+            curve['stopped'] = curve['stopped'] or 'ladder end'
+            curve['time_fit'] = fit_power_law(curve['sizes'], curve['times'], cfg['confidence'])
+            curve['memory_fit'] = fit_power_law(curve['sizes'], curve['memory_kb'], cfg['confidence'])
+            limits = [limit for limit in (predict_max_n(curve['time_fit'], cfg['time_budget']),
+                                          predict_max_n(curve['memory_fit'], memory_budget_kb))
+                      if limit is not None]
+            curve['max_n'] = min(limits) if limits else None
+
+        if benchmark_config['verbose']:
+            self.print_report(curves)
+        if cfg['plot_output']:
+            from smart_tsp_benchmark.visualization.plot_scaling import plot_scaling
+
+            plot_scaling(curves, cfg['plot_output'], backend=benchmark_config['plot_backend'])
+        return curves
+
+    def _skip(self, curve: Dict, n_points: int) -> bool:
+        cfg = self.scaling_config
+        fit = fit_power_law(curve['sizes'], curve['times'])
+        if fit is not None and predict_value(fit, n_points) > cfg['time_budget'] * cfg['overshoot']:
+            curve['stopped'] = f"predicted over time budget at n={n_points:,}"
+            return True
+        return False
+
+    def _run_rung(self, benchmark, curve: Dict, config, n_points: int):
+        cfg = self.scaling_config
+        times, memory = [], []
+        try:
+            for _ in range(cfg['repeats']):
+                measurement = benchmark.time_algorithm(config)
+                if measurement.get('invalid'):
+                    curve['stopped'] = f"invalid tour at n={n_points:,}"
+                    return
+                times.append(measurement['solve_time'] + measurement['post_opt_time'])
+                usage = measurement['resources']['total']
+                traced = usage['tracemalloc_peak_kb']
+                memory.append(traced if traced is not None else usage['peak_rss_delta_kb'])
+        except MemoryError:
+            curve['stopped'] = f"out of memory at n={n_points:,}"
+            return
+        except Exception:
+            curve['stopped'] = f"error at n={n_points:,}"
+            curve['error'] = traceback.format_exc()
+            return
+
+        curve['sizes'].append(n_points)
+        curve['times'].append(float(np.median(times)))
+        curve['memory_kb'].append(max(memory))
+        if curve['times'][-1] > cfg['time_budget']:
+            curve['stopped'] = f"time budget exceeded at n={n_points:,}"
+        elif cfg['memory_budget_mb'] and curve['memory_kb'][-1] > cfg['memory_budget_mb'] * 1024:
+            curve['stopped'] = f"memory budget exceeded at n={n_points:,}"
+
+    def _print_rung(self, name: str, curve: Dict, n_points: int):
+        if not self.benchmark.benchmark_config['verbose']:
+            return
+        if curve['sizes'] and curve['sizes'][-1] == n_points:
+            print(f"{name:<20} n={n_points:<10,} time={curve['times'][-1]:.4f} s "
+                  f"memory={curve['memory_kb'][-1] / 1024:.1f} MB")
+        else:
+            print(f"{name:<20} n={n_points:<10,} stopped: {curve['stopped']}")
+
+    def print_report(self, curves: Dict[str, Dict]):
+        cfg = self.scaling_config
+
+        def exponent(fit):
+            if fit is None:
+                return "-"
+            text = f"{fit['exponent']:.2f}"
+            if fit['exponent_ci'] is not None:
+                text += f" [{fit['exponent_ci'][0]:.2f}, {fit['exponent_ci'][1]:.2f}]"
+            if fit['r2'] is not None:
+                text += f" R²={fit['r2']:.3f}"
+            return text
+
+        def max_n(value):
+            if value is None:
+                return "-"
+            return "unbounded" if math.isinf(value) else f"{int(value):,}"
+
+        rows = [(name, f"{curve['sizes'][-1]:,}" if curve['sizes'] else "-", exponent(curve['time_fit']),
+                 exponent(curve['memory_fit']), max_n(curve['max_n']), curve['stopped'])
+                for name, curve in curves.items()]
+        headers = ("Algorithm", "Largest n", "Time exponent", "Memory exponent", "Max n in budget", "Stopped")
+        widths = [max(len(header), *(len(row[i]) for row in rows)) if rows else len(header)
+                  for i, header in enumerate(headers)]
+        header = " | ".join(f"{h:<{w}}" for h, w in zip(headers, widths))
+
+        print("\n" + "=" * len(header))
+        print("SCALING ANALYSIS".center(len(header)))
+        print("=" * len(header))
+        budget = f"time budget {cfg['time_budget']} s"
+        if cfg['memory_budget_mb']:
+            budget += f", memory budget {cfg['memory_budget_mb']} MB"
+        print(f"Fit: value ≈ a·n^b, {int(cfg['confidence'] * 100)}% CI on b; {budget}")
+        print(header)
+        print("-" * len(header))
+        for row in rows:
+            print(" | ".join(f"{cell:<{w}}" for cell, w in zip(row, widths)))
+        print("=" * len(header) + "\n")
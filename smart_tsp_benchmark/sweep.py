@@ -0,0 +1,177 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import itertools
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from smart_tsp_benchmark.reporting.sinks import SINKS, SWEEP_FIELDS, flatten_sweep, new_run_id
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    values = np.asarray(values, dtype=np.float64)
+    return {
+        'median': float(np.median(values)),
+        'p95': float(np.percentile(values, 95)),
+        'min': float(values.min()),
+        'std': float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+        'mean': float(values.mean())
+    }
+
+
+def cell_key(record: Dict) -> str:
+    return f"{record['point_generation']}|{record['n_points']}|{record['seed']}|{record['algorithm']}|{record['params']}"
+
+
+def run_cell(benchmark_cls, benchmark_config: Dict, cell: Dict, config, warmup: int, repeats: int) -> Dict:
+    record = dict(cell)
+    try:
+        benchmark = benchmark_cls(config={
+            **benchmark_config,
+            'n_points': cell['n_points'],
+            'seed': cell['seed'],
+            'point_generation': cell['point_generation'],
+            'verbose': False
+        })
+        benchmark.prepare_instance()
+
+        for _ in range(warmup):
+            benchmark.time_algorithm(config)
+
+        timings = {'time': [], 'solve_time': [], 'post_opt_time': [], 'eval_time': [], 'length': []}
+        for _ in range(repeats):
+            measurement = benchmark.time_algorithm(config)
+            if measurement.get('invalid'):
+                raise ValueError(f"Invalid tour: {measurement['invalid']}")
+            timings['time'].append(measurement['solve_time'] + measurement['post_opt_time'])
+            timings['solve_time'].append(measurement['solve_time'])
+            timings['post_opt_time'].append(measurement['post_opt_time'])
+            start_time = time.perf_counter()
+            timings['length'].append(benchmark.evaluate_route(measurement['route']))
+            timings['eval_time'].append(time.perf_counter() - start_time)
+
+        record['status'] = 'ok'
+        record.update({metric: summarize(values) for metric, values in timings.items()})
+    except Exception:
+        record['status'] = 'error'
+        record['error'] = traceback.format_exc()
+    return record
+
+
+class BenchmarkSweep:
+    DEFAULT_SWEEP = {
+        'sizes': [1000],
+        'seeds': [777],
+        'point_generation': ['random'],
+        'warmup': 1,
+        'repeats': 5,
+        'workers': 1,
+        'output': None,
+        'formats': ['jsonl']
+    }
+
+    def __init__(self, benchmark, sweep_config: Optional[Dict] = None):
+        self.benchmark = benchmark
+        self.sweep_config = {**self.DEFAULT_SWEEP, **(sweep_config or {})}
+
+    def cells(self) -> Iterable[Dict]:
+        cfg = self.sweep_config
+        algorithms = [(name, config) for name, config in self.benchmark.algorithms.items() if config.enabled]
+        for method, n_points, seed, (name, config) in itertools.product(
+                cfg['point_generation'], cfg['sizes'], cfg['seeds'], algorithms):
+            yield {
+                'point_generation': method,
+                'n_points': n_points,
+                'seed': seed,
+                'algorithm': name,
+                'params': config.params_key()
+            }, config
+
+    def completed_records(self) -> Iterator[Dict]:
+        output = self.sweep_config['output']
+        if output and os.path.exists(output):
+            with open(output) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = json.loads(line)
+                    if record.get('status') == 'ok':
+                        yield record
+
+    def sink_path(self, fmt: str, run_id: str) -> str:
+        output = self.sweep_config['output']
+        stem = os.path.splitext(output)[0]
+        if fmt == 'jsonl':
+            return output
+        if fmt == 'parquet':
+            return f"{stem}-{run_id}.parquet"
+        return f"{stem}.{fmt}"
+
+    def open_sinks(self, run_id: str) -> List:
+        if not self.sweep_config['output']:
+            return []
+        formats = list(dict.fromkeys(['jsonl', *self.sweep_config['formats']]))
+        unknown = [fmt for fmt in formats if fmt not in SINKS]
+        if unknown:
+            raise ValueError(f"Unknown results format(s): {', '.join(unknown)}")
+        return [SINKS[fmt](self.sink_path(fmt, run_id), SWEEP_FIELDS, flatten_sweep) for fmt in formats]
+
+    def stream(self) -> Iterator[Dict]:
+        wanted = {cell_key(cell) for cell, _ in self.cells()}
+        completed = set()
+        for record in self.completed_records():
+            key = cell_key(record)
+            if key in wanted and key not in completed:
+                completed.add(key)
+                yield record
+        todo = [(cell, config) for cell, config in self.cells() if cell_key(cell) not in completed]
+
+        if self.benchmark.benchmark_config['verbose']:
+            print(f"Sweep: {len(todo)} cell(s) to run, {len(completed)} already completed")
+
+        run_id = new_run_id()
+        sinks = self.open_sinks(run_id) if todo else []
+        try:
+            for record in self._execute(todo):
+                record.update({'run_id': run_id, 'timestamp': time.time()})
+                for sink in sinks:
+                    sink.write(record)
+                self._print_cell(record)
+                yield record
+        finally:
+            for sink in sinks:
+                sink.close()
+
+    def run(self) -> List[Dict]:
+        return list(self.stream())
+
+    def _execute(self, todo: List) -> Iterable[Dict]:
+        cfg = self.sweep_config
+        args = (type(self.benchmark), self.benchmark.benchmark_config)
+        if cfg['workers'] <= 1:
+            for cell, config in todo:
+                yield run_cell(*args, cell, config, cfg['warmup'], cfg['repeats'])
+            return
+
+        with ProcessPoolExecutor(max_workers=cfg['workers'], mp_context=get_context()) as executor:
+            futures = [executor.submit(run_cell, *args, cell, config, cfg['warmup'], cfg['repeats'])
+                       for cell, config in todo]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _print_cell(self, record: Dict):
+        if not self.benchmark.benchmark_config['verbose']:
+            return
+        cell = f"{record['point_generation']:<8} n={record['n_points']:<8} seed={record['seed']:<6} {record['algorithm']}"
+        if record['status'] != 'ok':
+            print(f"{cell}: FAILED ({record['error'].strip().splitlines()[-1]})")
+            return
+        t, length = record['time'], record['length']
+        print(f"{cell}: time median={t['median']:.4f} p95={t['p95']:.4f} min={t['min']:.4f} "
+              f"std={t['std']:.4f} | length median={length['median']:.2f} min={length['min']:.2f}")
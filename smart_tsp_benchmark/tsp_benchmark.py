@@ -1,57 +1,218 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import copy
+import json
+import math
+import os
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Dict, Callable, Any, Union, List
+from functools import partial
+from typing import Dict, Callable, Any, Iterator, Union, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from smart_tsp_benchmark.calculators.distance import DistanceOracle
 from smart_tsp_benchmark.calculators.length import calculate_length
+from smart_tsp_benchmark.calculators.tour import Route, as_route, validate_tour
 from smart_tsp_benchmark.generators.points import generate_points
+from smart_tsp_benchmark.pipeline import PipelineNode, run_pipeline, step_name, step_requires
 from smart_tsp_benchmark.optimizers.fast_opt import fast_post_optimize
-from smart_tsp_benchmark.visualization.plot_routes import plot_routes
+from smart_tsp_benchmark.optimizers.neighbor_opt import neighbor_post_optimize
+from smart_tsp_benchmark.profiling.phases import PhaseRecorder
+from smart_tsp_benchmark.profiling.resources import ResourceProbe, merge_metrics
 
 
 class BenchmarkStep:
+    name: Optional[str] = None
+    requires: Optional[Tuple[str, ...]] = None
+    exclusive: bool = False
 
     def execute(self, benchmark: 'TSPBenchmark', results: Dict):
         raise NotImplementedError
 
+    def is_exclusive(self, benchmark: 'TSPBenchmark') -> bool:
+        return self.exclusive
+
+    def on_result(self, benchmark: 'TSPBenchmark', name: str, result: Dict):
+        pass
+
 
 class PointGenerationStep(BenchmarkStep):
+    name = 'generate'
+    requires = ()
 
     def execute(self, benchmark: 'TSPBenchmark', results: Dict):
-        benchmark.points = generate_points(
-            benchmark.benchmark_config['n_points'],
-            benchmark.benchmark_config['seed'],
-            method=benchmark.benchmark_config['point_generation']
-        )
+        cfg = benchmark.benchmark_config
+        edge_weight_type = None
+        if cfg['instance']:
+            from smart_tsp_benchmark.loaders.tsplib import read_tsplib
+
+            instance = read_tsplib(cfg['instance'])
+            benchmark.points = instance.points
+            edge_weight_type = instance.edge_weight_type
+            cfg['n_points'] = len(benchmark.points)
+        elif cfg['instance_cache']:
+            from smart_tsp_benchmark.generators.cache import InstanceCache
+
+            cache = InstanceCache(cfg['instance_cache'], cfg['instance_cache_max_bytes'],
+                                  cfg['instance_cache_verify'])
+            benchmark.points = cache.get_or_generate(cfg['point_generation'], cfg['n_points'], cfg['seed'],
+                                                     dtype=cfg['point_dtype'])
+        else:
+            benchmark.points = generate_points(
+                cfg['n_points'],
+                cfg['seed'],
+                method=cfg['point_generation'],
+                dtype=cfg['point_dtype']
+            )
+        benchmark.source_points = benchmark.points
+        benchmark.point_order = None
+        benchmark.distance_oracle = DistanceOracle(benchmark.source_points,
+                                                   int(cfg['distance_memory_budget_mb'] * 1024 ** 2))
+
+        if (cfg['optimum'] is not None or cfg['optimal_tour']) and not cfg['closed_tour']:
+            raise ValueError("'optimum' and 'optimal_tour' describe closed tours; set 'closed_tour': True")
+        if cfg['instance'] and (cfg['optimum'] is not None or cfg['optimal_tour']) and edge_weight_type != 'EUC_2D':
+            raise ValueError(f"Gap to optimum needs a EUC_2D instance, but {cfg['instance']} uses "
+                             f"EDGE_WEIGHT_TYPE {edge_weight_type}, while routes are scored as Euclidean")
+        benchmark.optimum = cfg['optimum']
+        if benchmark.optimum is None and cfg['optimal_tour']:
+            from smart_tsp_benchmark.loaders.tsplib import read_tour
+
+            benchmark.optimum = benchmark.evaluate_route(read_tour(cfg['optimal_tour']))
+
+
+class PointOrderingStep(BenchmarkStep):
+    name = 'order'
+    requires = ('generate',)
+
+    def execute(self, benchmark: 'TSPBenchmark', results: Dict):
+        method = benchmark.benchmark_config['point_order']
+        if not method:
+            return
+        from smart_tsp_benchmark.generators.ordering import spatial_order
+
+        benchmark.point_order = spatial_order(benchmark.source_points, method, benchmark.benchmark_config['seed'])
+        benchmark.points = np.ascontiguousarray(benchmark.source_points[benchmark.point_order])
 
 
 class AlgorithmExecutionStep(BenchmarkStep):
+    name = 'execute'
+    requires = ('order',)
+    exclusive = True
 
     def execute(self, benchmark: 'TSPBenchmark', results: Dict):
-        for name, config in benchmark.algorithms.items():
-            if not config.enabled:
-                continue
+        algorithms = {name: config for name, config in benchmark.algorithms.items() if config.enabled}
+        cfg = benchmark.benchmark_config
+        if cfg['workers'] > 1 or cfg['isolate_algorithms'] or cfg['algorithm_memory_limit_mb']:
+            self._execute_parallel(benchmark, algorithms, results)
+        else:
+            self._execute_sequential(benchmark, algorithms, results)
+
+    def _execute_sequential(self, benchmark: 'TSPBenchmark', algorithms: Dict, results: Dict):
+        for name, config in algorithms.items():
+            benchmark.print_algorithm_start(name, config)
+            self._record(benchmark, results, name, config, benchmark.time_algorithm(config))
 
+    def _execute_parallel(self, benchmark: 'TSPBenchmark', algorithms: Dict, results: Dict):
+        from smart_tsp_benchmark.execution.parallel import ParallelAlgorithmRunner
+
+        cfg = benchmark.benchmark_config
+        runner = ParallelAlgorithmRunner(benchmark, cfg['workers'], cfg['algorithm_timeout'], cfg['pin_workers'],
+                                         cfg['algorithm_memory_limit_mb'])
+        for name, outcome in runner.run(algorithms):
+            config = algorithms[name]
             benchmark.print_algorithm_start(name, config)
+            if outcome['status'] == 'ok':
+                self._record(benchmark, results, name, config, outcome['measurement'])
+            else:
+                results[name] = benchmark.create_failed_result(outcome['status'], outcome['error'],
+                                                               outcome['time'], config)
+                benchmark.print_algorithm_failure(outcome['status'], outcome['error'])
+                benchmark.notify_result(name, results[name])
+
+    @staticmethod
+    def _record(benchmark: 'TSPBenchmark', results: Dict, name: str, config: 'AlgorithmConfig',
+                measurement: Dict):
+        measurement = dict(measurement)
+        route = measurement.pop('route')
+        post_opt_time = measurement.pop('post_opt_time')
+        exec_time = measurement.pop('solve_time') + post_opt_time
+
+        if measurement.get('invalid'):
+            results[name] = benchmark.create_failed_result('invalid', measurement['invalid'], exec_time, config)
+            benchmark.print_algorithm_failure('invalid', measurement['invalid'])
+            benchmark.notify_result(name, results[name])
+            return
 
-            start_time = time.perf_counter()
-            route = benchmark.execute_algorithm(config)
-            route = benchmark.apply_post_optimization(config, route)
-            exec_time = time.perf_counter() - start_time
-            route_length = calculate_length(benchmark.points, route)
+        start_time = time.perf_counter()
+        route_length = benchmark.evaluate_route(route)
+        eval_time = time.perf_counter() - start_time
 
-            results[name] = benchmark.create_result(route, exec_time, route_length, config)
-            benchmark.print_algorithm_end(exec_time, route_length)
+        results[name] = benchmark.create_result(route, exec_time, route_length, config,
+                                                post_opt_time=post_opt_time, eval_time=eval_time,
+                                                **measurement)
+        benchmark.print_algorithm_end(exec_time, route_length, post_opt_time)
+        benchmark.notify_result(name, results[name])
 
 
 class VisualizationStep(BenchmarkStep):
+    name = 'plot'
+    requires = ('execute',)
+
+    def is_exclusive(self, benchmark: 'TSPBenchmark') -> bool:
+        cfg = benchmark.benchmark_config
+        return cfg['plot_results'] and cfg['plot_output'] is None
 
     def execute(self, benchmark: 'TSPBenchmark', results: Dict):
         if benchmark.benchmark_config['plot_results']:
-            plot_routes(benchmark.points, {k: v['route'] for k, v in results.items()})
+            from smart_tsp_benchmark.visualization.plot_routes import plot_routes
+
+            cfg = benchmark.benchmark_config
+            completed = {name: data for name, data in results.items() if data['status'] == 'ok'}
+            saved = plot_routes(
+                benchmark.source_points,
+                {name: data['route'] for name, data in completed.items()},
+                {name: data['length'] for name, data in completed.items()},
+                output=cfg['plot_output'],
+                closed=cfg['closed_tour'],
+                image_format=cfg['plot_format'],
+                workers=cfg['plot_workers'],
+                backend=cfg['plot_backend']
+            )
+            if saved and cfg['verbose']:
+                print(f"Saved plots: {', '.join(saved)}")
+
+
+class ResultsSinkStep(BenchmarkStep):
+    name = 'sink'
+    requires = ('execute',)
+
+    def __init__(self):
+        self.writer = None
+
+    def on_result(self, benchmark: 'TSPBenchmark', name: str, result: Dict):
+        cfg = benchmark.benchmark_config
+        if not cfg['results_output']:
+            return
+        if self.writer is None:
+            from smart_tsp_benchmark.reporting.sinks import ResultsWriter
+
+            self.writer = ResultsWriter(cfg['results_output'], cfg['results_formats'], cfg)
+        self.writer.write(name, result)
+
+    def execute(self, benchmark: 'TSPBenchmark', results: Dict):
+        if self.writer is None:
+            return
+        self.writer.close()
+        if benchmark.benchmark_config['verbose']:
+            print(f"Results written to {self.writer.directory} (run {self.writer.run_id})")
+        self.writer = None
 
 
 class SummaryStep(BenchmarkStep):
+    name = 'summary'
+    requires = ('execute',)
 
     def execute(self, benchmark: 'TSPBenchmark', results: Dict):
         if benchmark.benchmark_config['verbose']:
@@ -75,20 +236,69 @@ class AlgorithmConfig:
     def was_manually_configured(self) -> bool:
         return self._manually_configured
 
+    def params_key(self) -> str:
+        return json.dumps(self.params, sort_keys=True, default=str)
+
 
 class TSPBenchmark:
+    POST_OPTIMIZERS = {
+        'window': fast_post_optimize,
+        'neighbor': neighbor_post_optimize,
+    }
+
     DEFAULT_CONFIG = {
         'n_points': 1000,
         'seed': 777,
         'point_generation': 'random',
+        'point_dtype': 'float64',
+        'point_order': None,
         'use_post_optimization': False,
+        'post_optimization_strategy': 'window',
         'plot_results': False,
-        'verbose': True
+        'plot_backend': None,
+        'plot_output': None,
+        'plot_format': 'png',
+        'plot_workers': 1,
+        'verbose': True,
+        'workers': 1,
+        'algorithm_timeout': None,
+        'pin_workers': False,
+        'isolate_algorithms': False,
+        'algorithm_memory_limit_mb': None,
+        'sweep': {},
+        'compare': {},
+        'scaling': {},
+        'tuning': {},
+        'instance_cache': None,
+        'instance_cache_max_bytes': 4 * 1024 ** 3,
+        'instance_cache_verify': 'header',
+        'instance': None,
+        'optimum': None,
+        'optimal_tour': None,
+        'closed_tour': False,
+        'distance_memory_budget_mb': 512,
+        'profile_resources': False,
+        'trace_memory': False,
+        'phase_breakdown': True,
+        'precise_timing': False,
+        'timing_core': None,
+        'timing_disable_gc': True,
+        'min_measure_time': 0.1,
+        'max_timing_loops': 1000,
+        'timing_repeats': 3,
+        'tie_tolerance': 0.02,
+        'pipeline_workers': 1,
+        'results_output': None,
+        'results_formats': ['jsonl', 'csv']
     }
 
     def __init__(self, config=None):
         self.points = None
-        self.benchmark_config = config if config is not None else self.DEFAULT_CONFIG
+        self.source_points = None
+        self.point_order = None
+        self.distance_oracle = None
+        self.optimum = None
+        self.benchmark_config = {**self.DEFAULT_CONFIG, **(config or {})}
         self._init_algorithms()
         self._init_benchmark_steps()
 
@@ -98,7 +308,9 @@ class TSPBenchmark:
     def _init_benchmark_steps(self):
         self.benchmark_steps = [
             PointGenerationStep(),
+            PointOrderingStep(),
             AlgorithmExecutionStep(),
+            ResultsSinkStep(),
             VisualizationStep(),
             SummaryStep()
         ]
@@ -130,20 +342,127 @@ class TSPBenchmark:
         if self.benchmark_config['verbose']:
             self._print_benchmark_header()
 
-        for step in self.benchmark_steps:
-            step.execute(self, results)
-
+        run_pipeline(self.pipeline_nodes(results), self.benchmark_config['pipeline_workers'])
         return results
 
+    def register_step(self, step: BenchmarkStep, requires: Optional[Sequence[str]] = None,
+                      name: Optional[str] = None):
+        if name is not None:
+            step.name = name
+        if requires is not None:
+            step.requires = tuple(requires)
+        self.benchmark_steps.append(step)
+
+    def pipeline_nodes(self, results: Dict, prefix: str = "") -> Dict[str, PipelineNode]:
+        nodes = {}
+        for index, step in enumerate(self.benchmark_steps):
+            key = prefix + step_name(step)
+            if key in nodes:
+                raise ValueError(f"Duplicate pipeline step name: {step_name(step)}")
+            nodes[key] = PipelineNode(
+                key,
+                partial(step.execute, self, results),
+                tuple(prefix + name for name in step_requires(self.benchmark_steps, index)),
+                step.is_exclusive(self)
+            )
+        return nodes
+
+    def derive(self, overrides: Dict) -> 'TSPBenchmark':
+        benchmark = type(self)(config={**self.benchmark_config, **overrides})
+        benchmark.algorithms = dict(self.algorithms)
+        benchmark.benchmark_steps = [copy.copy(step) for step in self.benchmark_steps]
+        return benchmark
+
+    def run_instances(self, instances: Sequence[Dict]) -> List[Dict]:
+        benchmarks = [self.derive(self._instance_outputs(index, overrides))
+                      for index, overrides in enumerate(instances)]
+        all_results = [{} for _ in benchmarks]
+        nodes = {}
+        previous_exclusive: Tuple[str, ...] = ()
+        for index, (benchmark, results) in enumerate(zip(benchmarks, all_results)):
+            instance_nodes = benchmark.pipeline_nodes(results, prefix=f"{index}:")
+            for node in instance_nodes.values():
+                if not node.requires or node.exclusive:
+                    node.requires += previous_exclusive
+            exclusive = tuple(key for key, node in instance_nodes.items() if node.exclusive)
+            if exclusive and benchmark.benchmark_config['verbose']:
+                first = instance_nodes[exclusive[0]]
+                first.action = partial(self._run_with_header, benchmark, first.action)
+            previous_exclusive = exclusive or previous_exclusive
+            nodes.update(instance_nodes)
+
+        run_pipeline(nodes, self.benchmark_config['pipeline_workers'])
+        return all_results
+
+    def _instance_outputs(self, index: int, overrides: Dict) -> Dict:
+        cfg = {**self.benchmark_config, **overrides}
+        overrides = dict(overrides)
+        suffix = f"instance-{index}"
+        if cfg['results_output'] and 'results_output' not in overrides:
+            overrides['results_output'] = os.path.join(cfg['results_output'], suffix)
+        if cfg['plot_output'] and 'plot_output' not in overrides:
+            root, extension = os.path.splitext(cfg['plot_output'])
+            if extension.lower() in ('.png', '.svg', '.pdf'):
+                overrides['plot_output'] = f"{root}-{suffix}{extension}"
+            else:
+                overrides['plot_output'] = os.path.join(cfg['plot_output'], suffix)
+        return overrides
+
+    @staticmethod
+    def _run_with_header(benchmark: 'TSPBenchmark', action: Callable[[], None]):
+        benchmark._print_benchmark_header()
+        action()
+
+    def run_sweep(self, sweep_config: Dict = None) -> List[Dict]:
+        from smart_tsp_benchmark.sweep import BenchmarkSweep
+
+        return BenchmarkSweep(self, {**self.benchmark_config['sweep'], **(sweep_config or {})}).run()
+
+    def stream_sweep(self, sweep_config: Dict = None) -> Iterator[Dict]:
+        from smart_tsp_benchmark.sweep import BenchmarkSweep
+
+        return BenchmarkSweep(self, {**self.benchmark_config['sweep'], **(sweep_config or {})}).stream()
+
+    def run_scaling(self, scaling_config: Dict = None) -> Dict[str, Dict]:
+        from smart_tsp_benchmark.scaling import ScalingSuite
+
+        return ScalingSuite(self, {**self.benchmark_config['scaling'], **(scaling_config or {})}).run()
+
+    def run_tuning(self, tuning_config: Dict = None) -> Dict[str, Dict]:
+        from smart_tsp_benchmark.tuning import HyperparameterSearch
+
+        return HyperparameterSearch(self, {**self.benchmark_config['tuning'], **(tuning_config or {})}).run()
+
+    def run_compare(self, compare_config: Dict = None) -> Dict:
+        from smart_tsp_benchmark.compare import BenchmarkComparison
+
+        return BenchmarkComparison(self, {**self.benchmark_config['compare'], **(compare_config or {})}).run()
+
     def _print_benchmark_header(self):
         cfg = self.benchmark_config
         print("\n" + "=" * 50)
         print("SMART TSP ALGORITHMS BENCHMARK".center(50))
         print("=" * 50)
-        print(f"{'Points:':<15} {cfg['n_points']}")
-        print(f"{'Seed:':<15} {cfg['seed']}")
-        print(f"{'Generation:':<15} {cfg['point_generation']}")
-        print(f"{'Post-opt:':<15} {'ON' if cfg['use_post_optimization'] else 'OFF'}")
+        if cfg['instance']:
+            print(f"{'Instance:':<15} {cfg['instance']}")
+        else:
+            print(f"{'Points:':<15} {cfg['n_points']}")
+            print(f"{'Seed:':<15} {cfg['seed']}")
+            print(f"{'Generation:':<15} {cfg['point_generation']}")
+        if cfg['point_order']:
+            print(f"{'Point order:':<15} {cfg['point_order']}")
+        if cfg['closed_tour']:
+            print(f"{'Tour:':<15} closed")
+        print(f"{'Post-opt:':<15} "
+              f"{cfg['post_optimization_strategy'] if cfg['use_post_optimization'] else 'OFF'}")
+        if cfg['workers'] > 1:
+            print(f"{'Workers:':<15} {cfg['workers']}{' (pinned)' if cfg['pin_workers'] else ''}")
+        if cfg['algorithm_memory_limit_mb']:
+            print(f"{'Memory limit:':<15} {cfg['algorithm_memory_limit_mb']} MB per algorithm")
+        if cfg['precise_timing']:
+            core = 'auto' if cfg['timing_core'] is None else cfg['timing_core']
+            print(f"{'Timing:':<15} precise (core {core}, GC {'off' if cfg['timing_disable_gc'] else 'on'}, "
+                  f"min {cfg['min_measure_time']} s per measurement)")
 
         print(f"{'Algorithms:':<15}")
         for name, cfg in self.algorithms.items():
@@ -157,104 +476,233 @@ class TSPBenchmark:
             print(f"Running {name} algorithm...")
             print(f"Description: {config.description}")
 
-    def execute_algorithm(self, config: AlgorithmConfig) -> List[int]:
+    def execute_algorithm(self, config: AlgorithmConfig) -> Route:
         if config.is_class:
             solver = config.function(**config.params)
             return solver.solve(self.points)
         return config.function(self.points, **config.params)
 
-    def apply_post_optimization(self, config: AlgorithmConfig, route: List[int]) -> List[int]:
-        if self.benchmark_config['use_post_optimization'] and config.post_optimize:
-            return fast_post_optimize(self.points, route)
+    def time_algorithm(self, config: AlgorithmConfig) -> Dict:
+        cfg = self.benchmark_config
+        if not cfg['precise_timing']:
+            return self._time_algorithm(config)
+        from smart_tsp_benchmark.profiling.timing import pinned_to_core
+
+        with pinned_to_core(cfg['timing_core']):
+            return self._time_algorithm(config)
+
+    def _time_algorithm(self, config: AlgorithmConfig) -> Dict:
+        cfg = self.benchmark_config
+        self.preload_post_optimizer(config)
+        profile = cfg['profile_resources']
+        trace_memory = cfg['trace_memory']
+        precise = cfg['precise_timing']
+        if precise:
+            from smart_tsp_benchmark.profiling.timing import gc_paused, refine_timing, timer_overhead
+
+            timed = partial(gc_paused, cfg['timing_disable_gc'])
+        else:
+            timed = nullcontext
+
+        with PhaseRecorder() as phases:
+            with timed(), ResourceProbe(trace_memory) if profile else nullcontext() as solve_probe:
+                start_time = time.perf_counter()
+                route = self.execute_algorithm(config)
+                solve_time = time.perf_counter() - start_time
+
+            route, invalid = self.normalize_route(route)
+            post_opt_time = 0.0
+            post_opt_probe = None
+            optimizer_input = None
+            if not invalid and self.should_post_optimize(config):
+                optimizer_input = route
+                with timed(), ResourceProbe(trace_memory) if profile else nullcontext() as post_opt_probe:
+                    start_time = time.perf_counter()
+                    route = self.apply_post_optimization(config, route)
+                    post_opt_time = time.perf_counter() - start_time
+                route, invalid = self.normalize_route(route)
+                if invalid:
+                    invalid = f"Post-optimization broke the tour: {invalid}"
+
+        measurement = {
+            'route': self.restore_route(route),
+            'solve_time': solve_time,
+            'post_opt_time': post_opt_time,
+            'phases': phases.phases
+        }
+        if precise and not invalid:
+            timing = (cfg['min_measure_time'], cfg['max_timing_loops'], cfg['timing_repeats'],
+                      cfg['timing_disable_gc'])
+            measurement['solve_time'], measurement['loops'] = refine_timing(
+                partial(self.execute_algorithm, config), solve_time, *timing)
+            if optimizer_input is not None:
+                measurement['post_opt_time'], measurement['post_opt_loops'] = refine_timing(
+                    partial(self.apply_post_optimization, config, optimizer_input), post_opt_time, *timing)
+            measurement['timer_overhead'] = timer_overhead()
+        if invalid:
+            measurement['invalid'] = invalid
+        if profile:
+            measurement['resources'] = {
+                'solve': solve_probe.metrics,
+                'post_opt': post_opt_probe.metrics if post_opt_probe else None,
+                'total': merge_metrics(solve_probe.metrics, post_opt_probe.metrics if post_opt_probe else None),
+                'traced': trace_memory
+            }
+        return measurement
+
+    def normalize_route(self, route: Route) -> Tuple[Optional[np.ndarray], Optional[str]]:
+        n_points = len(self.points)
+        invalid = validate_tour(route, n_points)
+        if invalid:
+            return None, invalid
+        return as_route(route, n_points), None
+
+    def restore_route(self, route: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if route is None or self.point_order is None:
+            return route
+        return self.point_order[route]
+
+    def prepare_instance(self):
+        PointGenerationStep().execute(self, {})
+        PointOrderingStep().execute(self, {})
+
+    def should_post_optimize(self, config: AlgorithmConfig) -> bool:
+        return self.benchmark_config['use_post_optimization'] and config.post_optimize
+
+    def preload_post_optimizer(self, config: AlgorithmConfig):
+        if self.should_post_optimize(config) and self.benchmark_config['post_optimization_strategy'] == 'neighbor':
+            import scipy.spatial  # noqa: F401
+
+    def apply_post_optimization(self, config: AlgorithmConfig, route: np.ndarray) -> np.ndarray:
+        if self.should_post_optimize(config):
+            strategy = self.benchmark_config['post_optimization_strategy']
+            if strategy not in self.POST_OPTIMIZERS:
+                raise ValueError(f"Unknown post-optimization strategy: {strategy}")
+            if strategy == 'neighbor':
+                return self.POST_OPTIMIZERS[strategy](self.points, route,
+                                                      closed=self.benchmark_config['closed_tour'])
+            return self.POST_OPTIMIZERS[strategy](self.points, route)
         return route
 
-    def create_result(self, route: List[int], exec_time: float, route_length: float, config: AlgorithmConfig) -> Dict:
+    def notify_result(self, name: str, result: Dict):
+        for step in self.benchmark_steps:
+            step.on_result(self, name, result)
+
+    def evaluate_route(self, route: Route) -> float:
+        return calculate_length(self.source_points, route, closed=self.benchmark_config['closed_tour'])
+
+    def score_routes(self, routes: Union[np.ndarray, List[Route]]) -> np.ndarray:
+        return self.distance_oracle.lengths(routes, closed=self.benchmark_config['closed_tour'])
+
+    def create_result(self, route: np.ndarray, exec_time: float, route_length: float, config: AlgorithmConfig,
+                      post_opt_time: float = 0.0, eval_time: float = 0.0, **metrics) -> Dict:
         return {
+            'status': 'ok',
             'route': route,
             'time': exec_time,
+            'solve_time': exec_time - post_opt_time,
+            'post_opt_time': post_opt_time,
+            'eval_time': eval_time,
             'length': route_length,
+            'gap': (route_length / self.optimum - 1) * 100 if self.optimum else None,
+            'points': self.benchmark_config['n_points'],
+            'params': config.params,
+            **metrics
+        }
+
+    def create_failed_result(self, status: str, error: str, elapsed: float, config: AlgorithmConfig) -> Dict:
+        return {
+            'status': status,
+            'error': error,
+            'route': None,
+            'time': elapsed,
+            'length': None,
             'points': self.benchmark_config['n_points'],
             'params': config.params
         }
 
-    def print_algorithm_end(self, exec_time: float, route_length: float):
+    def print_algorithm_failure(self, status: str, error: str):
+        if self.benchmark_config['verbose']:
+            print(f"FAILED ({status}): {error.strip().splitlines()[-1]}")
+            print(f"{'=' * 50}")
+
+    def print_algorithm_end(self, exec_time: float, route_length: float, post_opt_time: float = 0.0):
         if self.benchmark_config['verbose']:
             print(f"Completed in {exec_time:.4f} seconds")
+            if post_opt_time:
+                print(f"Solver: {exec_time - post_opt_time:.4f} s, post-optimization: {post_opt_time:.4f} s")
             print(f"Route length: {route_length:.2f}")
             print(f"{'=' * 50}")
 
     def print_comparison_table(self, results: Dict):
+        failed = {name: data for name, data in results.items() if data['status'] != 'ok'}
+        results = {name: data for name, data in results.items() if data['status'] == 'ok'}
+        if failed:
+            print("\nFAILED ALGORITHMS:")
+            for name, data in failed.items():
+                print(f"- {name}: {data['status']} after {data['time']:.4f} sec")
         if not results:
             return
 
         best_time = min(r['time'] for r in results.values())
         best_length = min(r['length'] for r in results.values())
+        tolerance = self.benchmark_config['tie_tolerance']
+        time_digits = 6 if self.benchmark_config['precise_timing'] else 4
 
+        green, reset = '\033[92m', '\033[0m'
+        columns = self._table_columns(results)
         table_rows = []
-        color_codes = {
-            'green': '\033[92m',
-            'reset': '\033[0m'
-        }
 
-        for name, data in sorted(results.items(), key=lambda x: (x[1]['time'], x[1]['length'])):
-            time_plain = f"{data['time']:.4f}"
-            length_plain = f"{data['length']:.2f}"
-            time_diff_plain = "BEST" if data['time'] == best_time else f"+{(data['time'] / best_time - 1) * 100:.2f}%"
-            length_diff_plain = "BEST" if data[
-                                              'length'] == best_length else f"+{(data['length'] / best_length - 1) * 100:.2f}%"
-            params_plain = ", ".join(f"{k}={v}" for k, v in data['params'].items())
-
-            time_str = f"{color_codes['green']}{time_plain}{color_codes['reset']}" if data[
-                                                                                          'time'] == best_time else time_plain
-            length_str = f"{color_codes['green']}{length_plain}{color_codes['reset']}" if data[
-                                                                                              'length'] == best_length else length_plain
-            time_diff = f"{color_codes['green']}{time_diff_plain}{color_codes['reset']}" if data[
-                                                                                                'time'] == best_time else time_diff_plain
-            length_diff = f"{color_codes['green']}{length_diff_plain}{color_codes['reset']}" if data[
-                                                                                                    'length'] == best_length else length_diff_plain
-
-            table_rows.append({
-                'name': name,
-                'time': (time_str, time_plain),
-                'time_diff': (time_diff, time_diff_plain),
-                'length': (length_str, length_plain),
-                'length_diff': (length_diff, length_diff_plain),
-                'params': params_plain
-            })
+        def rank(item):
+            data = item[1]
+            tied = self._is_tie(data['time'], best_time, tolerance)
+            return (best_time if tied else data['time'], data['length'], data['time'])
+
+        for name, data in sorted(results.items(), key=rank):
+            is_fastest = self._is_tie(data['time'], best_time, tolerance)
+            is_shortest = self._is_tie(data['length'], best_length)
+            row = {
+                'name': (name, False),
+                'time': (f"{data['time']:.{time_digits}f}", is_fastest),
+                'time_diff': ("BEST" if is_fastest else f"+{(data['time'] / best_time - 1) * 100:.2f}%", is_fastest),
+                'length': (f"{data['length']:.2f}", is_shortest),
+                'length_diff': ("BEST" if is_shortest else f"+{(data['length'] / best_length - 1) * 100:.2f}%",
+                                is_shortest),
+                'params': (", ".join(f"{k}={v}" for k, v in data['params'].items()), False)
+            }
+            if data.get('gap') is not None:
+                row['gap'] = (f"{data['gap']:+.2f}%", False)
+            if data.get('loops') is not None:
+                loops = str(data['loops'])
+                if data.get('post_opt_loops') is not None:
+                    loops += f"/{data['post_opt_loops']}"
+                row['loops'] = (loops, False)
+            if data.get('resources'):
+                usage = data['resources']['total']
+                row['rss'] = (f"{usage['peak_rss_delta_kb'] / 1024:.1f}", False)
+                row['cpu'] = (f"{usage['cpu_user']:.2f}/{usage['cpu_sys']:.2f}", False)
+                row['gc'] = ("/".join(str(count) for count in usage['gc_collections']), False)
+                row['threads'] = (str(usage['threads']), False)
+                if usage['tracemalloc_peak_kb'] is not None:
+                    row['traced'] = (f"{usage['tracemalloc_peak_kb'] / 1024:.1f}", False)
+            table_rows.append(row)
 
         col_widths = {
-            'name': max(len(row['name']) for row in table_rows) + 2,
-            'time': max(len(row['time'][1]) for row in table_rows),
-            'time_diff': max(len(row['time_diff'][1]) for row in table_rows),
-            'length': max(len(row['length'][1]) for row in table_rows),
-            'length_diff': max(len(row['length_diff'][1]) for row in table_rows),
-            'params': max(len(row['params']) for row in table_rows) + 2
+            key: max([len(title)] + [len(row.get(key, ('', False))[0]) for row in table_rows])
+            for key, title, _ in columns
         }
-
-        row_fmt = (
-            "{name:<{name_w}} | "
-            "{time:>{time_w}} | "
-            "{time_diff:^{time_diff_w}} | "
-            "{length:>{length_w}} | "
-            "{length_diff:^{length_diff_w}} | "
-            "{params:<{params_w}}"
-        )
-
-        header = row_fmt.format(
-            name="Algorithm",
-            name_w=col_widths['name'],
-            time="Time (s)",
-            time_w=col_widths['time'],
-            time_diff="vs Best",
-            time_diff_w=col_widths['time_diff'],
-            length="Length",
-            length_w=col_widths['length'],
-            length_diff="vs Best",
-            length_diff_w=col_widths['length_diff'],
-            params="Params",
-            params_w=col_widths['params']
-        )
-
+        col_widths['name'] += 2
+        col_widths['params'] += 2
+
+        def format_row(cells):
+            formatted = []
+            for key, _, align in columns:
+                text, highlight = cells.get(key, ('', False))
+                text = f"{text:{align}{col_widths[key]}}"
+                formatted.append(f"{green}{text}{reset}" if highlight else text)
+            return " | ".join(formatted)
+
+        header = format_row({key: (title, False) for key, title, _ in columns})
         separator = "-" * len(header)
         full_width = len(header)
 
@@ -265,33 +713,51 @@ class TSPBenchmark:
         print(separator)
 
         for row in table_rows:
-            print(row_fmt.format(
-                name=row['name'],
-                name_w=col_widths['name'],
-                time=row['time'][0],
-                time_w=col_widths['time'],
-                time_diff=row['time_diff'][0],
-                time_diff_w=col_widths['time_diff'],
-                length=row['length'][0],
-                length_w=col_widths['length'],
-                length_diff=row['length_diff'][0],
-                length_diff_w=col_widths['length_diff'],
-                params=row['params'],
-                params_w=col_widths['params']
-            ))
+            print(format_row(row))
 
         print("=" * full_width + "\n")
-        self._print_performance_analysis(results, best_time, best_length)
+        self._print_performance_analysis(results, best_time, best_length, tolerance)
+        if self.benchmark_config['phase_breakdown']:
+            self._print_phase_breakdown(results)
+
+    @staticmethod
+    def _table_columns(results: Dict) -> List[Tuple[str, str, str]]:
+        columns = [
+            ('name', "Algorithm", '<'),
+            ('time', "Time (s)", '>'),
+            ('time_diff', "vs Best", '^'),
+            ('length', "Length", '>'),
+            ('length_diff', "vs Best", '^')
+        ]
+        if any(data.get('gap') is not None for data in results.values()):
+            columns.append(('gap', "vs Opt", '^'))
+        if any(data.get('loops') is not None for data in results.values()):
+            columns.append(('loops', "Loops", '>'))
+        if any(data.get('resources') for data in results.values()):
+            columns.extend([
+                ('rss', "Peak RSS (MB)", '>'),
+                ('cpu', "CPU usr/sys (s)", '>'),
+                ('gc', "GC gen0/1/2", '>'),
+                ('threads', "Threads", '>')
+            ])
+            if any(data['resources']['traced'] for data in results.values() if data.get('resources')):
+                columns.append(('traced', "Traced (MB)", '>'))
+        columns.append(('params', "Params", '<'))
+        return columns
 
     @staticmethod
-    def _format_value(value, best_value, format_spec):
-        if value == best_value:
+    def _is_tie(value: float, best_value: float, tolerance: float = 0.0) -> bool:
+        return value <= best_value * (1 + tolerance) or math.isclose(value, best_value, rel_tol=1e-9)
+
+    @classmethod
+    def _format_value(cls, value, best_value, format_spec, tolerance: float = 0.0):
+        if cls._is_tie(value, best_value, tolerance):
             return f"\033[92m{value:{format_spec}}\033[0m"
         return f"{value:{format_spec}}"
 
-    @staticmethod
-    def _format_diff(value, best_value):
-        if value == best_value:
+    @classmethod
+    def _format_diff(cls, value, best_value, tolerance: float = 0.0):
+        if cls._is_tie(value, best_value, tolerance):
             return "\033[92mBEST\033[0m"
         diff = (value / best_value - 1) * 100
         return f"+{diff:.2f}%"
@@ -336,18 +802,45 @@ class TSPBenchmark:
         full_width = sum(col_widths) + len(col_widths) * 3 - 1
         print("=" * full_width + "\n")
 
-    @staticmethod
-    def _print_performance_analysis(results, best_time, best_length):
-        time_leaders = [name for name, data in results.items() if data['time'] == best_time]
-        length_leaders = [name for name, data in results.items() if data['length'] == best_length]
+    @classmethod
+    def _print_performance_analysis(cls, results, best_time, best_length, tolerance: float = 0.0):
+        time_leaders = [name for name, data in results.items() if cls._is_tie(data['time'], best_time, tolerance)]
+        length_leaders = [name for name, data in results.items() if cls._is_tie(data['length'], best_length)]
 
         print("PERFORMANCE ANALYSIS:")
-        print(f"- Fastest algorithm(s): {', '.join(time_leaders)} ({best_time:.4f} sec)")
+        band = f", tied within {tolerance * 100:g}%" if tolerance and len(time_leaders) > 1 else ""
+        print(f"- Fastest algorithm(s): {', '.join(time_leaders)} ({best_time:.{6 if best_time < 1e-3 else 4}f} sec{band})")
         print(f"- Shortest route(s): {', '.join(length_leaders)} ({best_length:.2f} units)")
+        gaps = [data['gap'] for data in results.values() if data.get('gap') is not None]
+        if gaps:
+            print(f"- Best gap to optimum: {min(gaps):+.2f}%")
+
+        profiled = [data['resources'] for data in results.values() if data.get('resources')]
+        if profiled:
+            overhead = max(usage['total']['overhead'] for usage in profiled)
+            print(f"- Instrumentation overhead: up to {overhead * 1000:.3f} ms per algorithm, "
+                  f"outside the timed sections")
+            if any(usage['traced'] for usage in profiled):
+                print("- tracemalloc was active: timings include its tracing overhead")
 
         if set(time_leaders) == set(length_leaders):
             print(f"\n⭐️ BEST BALANCED: {', '.join(time_leaders)} (fastest and shortest)")
 
+    @staticmethod
+    def _print_phase_breakdown(results):
+        timed = {name: data for name, data in results.items() if data.get('phases')}
+        if not timed:
+            return
+
+        print("\nPHASE BREAKDOWN:")
+        for name, data in sorted(timed.items(), key=lambda x: x[1]['time']):
+            print(f"- {name}: solver {data['solve_time']:.4f} s, post-opt {data['post_opt_time']:.4f} s, "
+                  f"eval {data['eval_time']:.4f} s")
+            for phase_name, entry in sorted(data['phases'].items()):
+                share = entry['time'] / data['time'] * 100 if data['time'] else 0.0
+                calls = f" ({entry['calls']} calls)" if entry['calls'] > 1 else ""
+                print(f"    {phase_name:<30} {entry['time']:.4f} s {share:6.2f}%{calls}")
+
     def set_algorithm_params(self, algo_name: str, **params):
         if algo_name in self.algorithms:
             params.pop('is_class', None)
@@ -0,0 +1,217 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import dataclasses
+import math
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def sample_value(spec, rng: np.random.Generator) -> Any:
+    if isinstance(spec, list):
+        return spec[int(rng.integers(len(spec)))]
+    if isinstance(spec, tuple):
+        spec = {'low': spec[0], 'high': spec[1]}
+    if isinstance(spec, dict):
+        low, high = spec['low'], spec['high']
+        if spec.get('log'):
+            value = math.exp(rng.uniform(math.log(low), math.log(high)))
+        else:
+            value = rng.uniform(low, high)
+        if isinstance(low, int) and isinstance(high, int):
+            return min(high, max(low, int(round(value))))
+        return float(value)
+    raise ValueError(f"Unsupported search space entry: {spec!r}")
+
+
+def sample_params(space: Dict[str, Any], rng: np.random.Generator) -> Dict[str, Any]:
+    return {name: sample_value(spec, rng) for name, spec in space.items()}
+
+
+def dominates(a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+    return a[0] <= b[0] and a[1] <= b[1] and a != b
+
+
+def pareto_ranks(objectives: Sequence[Tuple[float, float]]) -> List[int]:
+    ranks = [-1] * len(objectives)
+    remaining = set(range(len(objectives)))
+    rank = 0
+    while remaining:
+        front = {i for i in remaining
+                 if not any(dominates(objectives[j], objectives[i]) for j in remaining if j != i)}
+        for i in front:
+            ranks[i] = rank
+        remaining -= front
+        rank += 1
+    return ranks
+
+
+def crowding_distances(objectives: Sequence[Tuple[float, float]], members: Sequence[int]) -> Dict[int, float]:
+    distances = {i: 0.0 for i in members}
+    for axis in range(2):
+        ordered = sorted(members, key=lambda i: objectives[i][axis])
+        span = objectives[ordered[-1]][axis] - objectives[ordered[0]][axis]
+        distances[ordered[0]] = distances[ordered[-1]] = math.inf
+        if span <= 0:
+            continue
+        for previous, current, following in zip(ordered, ordered[1:], ordered[2:]):
+            distances[current] += (objectives[following][axis] - objectives[previous][axis]) / span
+    return distances
+
+
+def run_trial(benchmark_cls, benchmark_config: Dict, config, n_points: int, seed: int, repeats: int) -> Dict:
+    try:
+        benchmark = benchmark_cls(config={
+            **benchmark_config,
+            'n_points': n_points,
+            'seed': seed,
+            'instance': None,
+            'verbose': False
+        })
+        benchmark.prepare_instance()
+        times, lengths = [], []
+        for _ in range(repeats):
+            measurement = benchmark.time_algorithm(config)
+            if measurement.get('invalid'):
+                raise ValueError(f"Invalid tour: {measurement['invalid']}")
+            times.append(measurement['solve_time'] + measurement['post_opt_time'])
+            lengths.append(benchmark.evaluate_route(measurement['route']))
+        return {'time': float(np.median(times)), 'length': float(np.median(lengths))}
+    except Exception:
+        return {'error': traceback.format_exc()}
+
+
+class HyperparameterSearch:
+    DEFAULT_TUNING = {
+        'search_space': {},
+        'strategy': 'halving',
+        'n_trials': 16,
+        'sizes': [200, 1000, 5000],
+        'seeds': [777, 778],
+        'point_generation': 'random',
+        'eta': 3,
+        'repeats': 1,
+        'workers': 1,
+        'seed': 0
+    }
+
+    def __init__(self, benchmark, tuning_config: Optional[Dict] = None):
+        self.benchmark = benchmark
+        self.tuning_config = {**self.DEFAULT_TUNING, **(tuning_config or {})}
+        if self.tuning_config['strategy'] not in ('halving', 'random'):
+            raise ValueError(f"Unknown search strategy: {self.tuning_config['strategy']}")
+        unknown = set(self.tuning_config['search_space']) - set(benchmark.algorithms)
+        if unknown:
+            raise ValueError(f"Search space refers to unknown algorithm(s): {', '.join(sorted(unknown))}")
+
+    def run(self) -> Dict[str, Dict]:
+        cfg = self.tuning_config
+        rng = np.random.default_rng(cfg['seed'])
+        sizes = sorted(cfg['sizes'])
+        eta = cfg['eta'] if cfg['strategy'] == 'halving' else 1
+        benchmark_config = {**self.benchmark.benchmark_config, 'point_generation': cfg['point_generation']}
+        executor = None
+        if cfg['workers'] > 1:
+            executor = ProcessPoolExecutor(max_workers=cfg['workers'], mp_context=get_context())
+
+        results = {}
+        try:
+            for name, space in cfg['search_space'].items():
+                config = self.benchmark.algorithms[name]
+                trials = [{'params': dict(config.params), 'rungs': {}}]
+                trials += [{'params': {**config.params, **sample_params(space, rng)}, 'rungs': {}}
+                           for _ in range(max(0, cfg['n_trials'] - 1))]
+                active = trials
+                for rung, n_points in enumerate(sizes):
+                    self._evaluate(executor, benchmark_config, config, active, n_points)
+                    evaluated = len(active)
+                    active = [trial for trial in active if 'error' not in trial['rungs'][n_points]]
+                    self._print_rung(name, n_points, active, evaluated)
+                    if rung < len(sizes) - 1 and eta > 1:
+                        active = self._promote(active, n_points, eta)
+                results[name] = self._summarize(trials, active, sizes[-1])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.benchmark.benchmark_config['verbose']:
+            self.print_report(results)
+        return results
+
+    def _evaluate(self, executor, benchmark_config: Dict, config, trials: List[Dict], n_points: int):
+        cfg = self.tuning_config
+        tasks = [(trial, dataclasses.replace(config, params=trial['params']), seed)
+                 for trial in trials for seed in cfg['seeds']]
+        args = (type(self.benchmark), benchmark_config)
+        if executor is None:
+            outcomes = [run_trial(*args, trial_config, n_points, seed, cfg['repeats'])
+                        for _, trial_config, seed in tasks]
+        else:
+            futures = [executor.submit(run_trial, *args, trial_config, n_points, seed, cfg['repeats'])
+                       for _, trial_config, seed in tasks]
+            outcomes = [future.result() for future in futures]
+
+        per_trial: Dict[int, List[Dict]] = {}
+        for (trial, _, _), outcome in zip(tasks, outcomes):
+            per_trial.setdefault(id(trial), []).append(outcome)
+        for trial in trials:
+            outcomes = per_trial[id(trial)]
+            errors = [outcome['error'] for outcome in outcomes if 'error' in outcome]
+            if errors:
+                trial['rungs'][n_points] = {'error': errors[0]}
+            else:
+                trial['rungs'][n_points] = {
+                    'time': float(np.mean([outcome['time'] for outcome in outcomes])),
+                    'length': float(np.mean([outcome['length'] for outcome in outcomes]))
+                }
+
+    @staticmethod
+    def _promote(trials: List[Dict], n_points: int, eta: int) -> List[Dict]:
+        objectives = [(trial['rungs'][n_points]['time'], trial['rungs'][n_points]['length']) for trial in trials]
+        ranks = pareto_ranks(objectives)
+        crowding = {}
+        for rank in set(ranks):
+            crowding.update(crowding_distances(objectives, [i for i in range(len(trials)) if ranks[i] == rank]))
+        order = sorted(range(len(trials)), key=lambda i: (ranks[i], -crowding[i]))
+        keep = max(math.ceil(len(trials) / eta), ranks.count(0))
+        return [trials[i] for i in order[:keep]]
+
+    @staticmethod
+    def _summarize(trials: List[Dict], finalists: List[Dict], n_points: int) -> Dict:
+        objectives = [(trial['rungs'][n_points]['time'], trial['rungs'][n_points]['length']) for trial in finalists]
+        ranks = pareto_ranks(objectives)
+        front = sorted((trial for trial, rank in zip(finalists, ranks) if rank == 0),
+                       key=lambda trial: trial['rungs'][n_points]['time'])
+        return {
+            'size': n_points,
+            'trials': trials,
+            'pareto_front': [{'params': trial['params'], **trial['rungs'][n_points]} for trial in front]
+        }
+
+    def _print_rung(self, name: str, n_points: int, completed: List[Dict], evaluated: int):
+        if self.benchmark.benchmark_config['verbose']:
+            best = min((trial['rungs'][n_points]['length'] for trial in completed), default=None)
+            best_text = f", best length {best:.2f}" if best is not None else ""
+            print(f"{name:<20} n={n_points:<8} {len(completed)}/{evaluated} configuration(s) completed{best_text}")
+
+    @staticmethod
+    def print_report(results: Dict[str, Dict]):
+        for name, result in results.items():
+            rows = [(f"{entry['time']:.4f}", f"{entry['length']:.2f}",
+                     ", ".join(f"{k}={v}" for k, v in entry['params'].items()))
+                    for entry in result['pareto_front']]
+            headers = ("Time (s)", "Length", "Params")
+            widths = [max(len(header), *(len(row[i]) for row in rows)) if rows else len(header)
+                      for i, header in enumerate(headers)]
+            header = " | ".join(f"{h:<{w}}" for h, w in zip(headers, widths))
+
+            print("\n" + "=" * len(header))
+            print(f"PARETO FRONT: {name} (n={result['size']})".center(len(header)))
+            print("=" * len(header))
+            print(header)
+            print("-" * len(header))
+            for row in rows:
+                print(" | ".join(f"{cell:<{w}}" for cell, w in zip(row, widths)))
+            print("=" * len(header))
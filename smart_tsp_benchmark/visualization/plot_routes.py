@@ -1,55 +1,112 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
-from typing import Dict, List
+import math
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, List, Optional
+
+import matplotlib
 import numpy as np
 from matplotlib import pyplot as plt
 
+from smart_tsp_benchmark.calculators.length import calculate_length
+from smart_tsp_benchmark.calculators.tour import Route
+from smart_tsp_benchmark.execution.shared import SharedArray
 
-from itertools import cycle
+COLORS = ['red', 'green', 'blue', 'purple', 'orange']
+LARGE_INSTANCE = 5000
+IMAGE_FORMATS = ('.png', '.svg', '.pdf')
+AGG_CHUNK_SIZE = 10000
 
-from smart_tsp_benchmark.calculators.length import calculate_length
 
+def select_backend(backend: Optional[str] = None):
+    if backend:
+        matplotlib.use(backend)
+    elif (not os.environ.get('MPLBACKEND') and sys.platform.startswith('linux')
+          and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))):
+        matplotlib.use('Agg')
 
-def plot_routes(points: np.ndarray, routes: Dict[str, List[int]]):
-    plt.figure(figsize=(18, 6))
-    colors = cycle(['red', 'green', 'blue', 'purple', 'orange'])
 
+def _draw_route(ax, points: np.ndarray, route, name: str, length: float, color: str, closed: bool):
     n_points = len(points)
+    large = n_points > LARGE_INSTANCE
+    route = np.asarray(route)
 
-    if n_points > 5000:
-        display_step = max(1, n_points // 1000)
-        route_step = max(1, len(next(iter(routes.values()))) // 500)
-        alpha = 0.3
-        line_width = 1
+    if large:
+        ax.plot(points[:, 0], points[:, 1], ',', color='gray', alpha=0.3, rasterized=True)
     else:
-        display_step = 1
-        route_step = 1
-        alpha = 0.7
-        line_width = 2
+        ax.scatter(points[:, 0], points[:, 1], c='gray', alpha=0.35, s=10)
+
+    if len(route) > 0:
+        path = points[route]
+        if closed:
+            path = np.concatenate([path, path[:1]])
+        ax.plot(path[:, 0], path[:, 1], color=color, linewidth=0.5 if large else 2,
+                alpha=0.6 if large else 0.7, label=name, rasterized=large)
+        ax.scatter(points[route[0], 0], points[route[0], 1], c='black', s=100, marker='*', zorder=3)
+
+    ax.set_title(f"{name}\nPoints: {n_points:,}\nLength: {length:.2f}")
+    ax.axis('equal')
+    ax.legend(loc='upper right')
+
 
-    display_mask = np.zeros(n_points, dtype=bool)
-    display_mask[::display_step] = True
+def _render_single(points_descriptor, name: str, route, length: float, color: str, path: str,
+                   closed: bool, dpi: int, backend: Optional[str] = None) -> str:
+    select_backend(backend)
+    points = SharedArray.attach(points_descriptor)
+    try:
+        fig, ax = plt.subplots(figsize=(8, 8))
+        _draw_route(ax, points.array, route, name, length, color, closed)
+        fig.tight_layout()
+        with matplotlib.rc_context({'agg.path.chunksize': AGG_CHUNK_SIZE}):
+            fig.savefig(path, dpi=dpi)
+        plt.close(fig)
+    finally:
+        points.close()
+    return path
 
-    for i, (name, route) in enumerate(routes.items()):
-        plt.subplot(1, len(routes), i + 1)
 
-        plt.scatter(points[display_mask, 0], points[display_mask, 1],
-                    c='gray', alpha=alpha * 0.5, s=10)
+def _file_name(name: str, image_format: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_') + '.' + image_format
 
-        simplified_route = route[::route_step]
-        if len(route) > 0:
-            simplified_route.append(route[0])
 
-        color = next(colors)
-        plt.plot(points[simplified_route, 0], points[simplified_route, 1],
-                 color=color, linewidth=line_width, label=name)
+def plot_routes(points: np.ndarray, routes: Dict[str, Route], lengths: Optional[Dict[str, float]] = None,
+                output: Optional[str] = None, closed: bool = True, image_format: str = 'png',
+                workers: int = 1, dpi: int = 100, backend: Optional[str] = None) -> List[str]:
+    select_backend(backend)
+    lengths = dict(lengths or {})
+    for name, route in routes.items():
+        if lengths.get(name) is None:
+            lengths[name] = calculate_length(points, route, closed=closed)
+    colors = {name: COLORS[i % len(COLORS)] for i, name in enumerate(routes)}
 
-        if len(route) > 0:
-            plt.scatter(points[route[0], 0], points[route[0], 1],
-                        c='black', s=100, marker='*', zorder=3)
+    if output is not None and not output.lower().endswith(IMAGE_FORMATS):
+        os.makedirs(output, exist_ok=True)
+        jobs = [(name, route, lengths[name], colors[name], os.path.join(output, _file_name(name, image_format)))
+                for name, route in routes.items()]
+        with SharedArray.create(points) as shared:
+            if workers > 1 and len(jobs) > 1:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=get_context()) as executor:
+                    futures = [executor.submit(_render_single, shared.descriptor, *job, closed, dpi, backend)
+                               for job in jobs]
+                    return [future.result() for future in futures]
+            return [_render_single(shared.descriptor, *job, closed, dpi, backend) for job in jobs]
 
-        plt.title(f"{name}\nPoints: {n_points:,}\nLength: {calculate_length(points, route):.2f}")
-        plt.axis('equal')
-        plt.legend()
+    cols = min(3, max(1, len(routes)))
+    rows = max(1, math.ceil(len(routes) / cols))
+    fig, axes = plt.subplots(rows, cols, figsize=(6 * cols, 6 * rows), squeeze=False)
+    for ax, (name, route) in zip(axes.flat, routes.items()):
+        _draw_route(ax, points, route, name, lengths[name], colors[name], closed)
+    for ax in list(axes.flat)[len(routes):]:
+        ax.set_visible(False)
+    fig.tight_layout()
 
-    plt.tight_layout()
-    plt.show()
+    if output is None:
+        plt.show()
+        return []
+    with matplotlib.rc_context({'agg.path.chunksize': AGG_CHUNK_SIZE}):
+        fig.savefig(output, dpi=dpi)
+    plt.close(fig)
+    return [output]
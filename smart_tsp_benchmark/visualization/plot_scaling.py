@@ -0,0 +1,37 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from typing import Dict, Optional
+
+import numpy as np
+
+from smart_tsp_benchmark.visualization.plot_routes import COLORS, plt, select_backend
+
+
+def plot_scaling(curves: Dict[str, Dict], output: str, dpi: int = 100, backend: Optional[str] = None) -> str:
+    select_backend(backend)
+    fig, (time_ax, memory_ax) = plt.subplots(1, 2, figsize=(14, 6))
+    for i, (name, curve) in enumerate(curves.items()):
+        if not curve['sizes']:
+            continue
+        color = COLORS[i % len(COLORS)]
+        sizes = np.asarray(curve['sizes'], dtype=np.float64)
+        for ax, values, fit in ((time_ax, curve['times'], curve['time_fit']),
+                                (memory_ax, np.asarray(curve['memory_kb']) / 1024, curve['memory_fit'])):
+            ax.plot(sizes, values, 'o', color=color, label=name)
+            if fit is not None:
+                scale = 1024 if ax is memory_ax else 1
+                ax.plot(sizes, fit['coefficient'] * sizes ** fit['exponent'] / scale, '--', color=color,
+                        label=f"{name} fit n^{fit['exponent']:.2f}")
+
+    for ax, title, label in ((time_ax, "Time", "seconds"), (memory_ax, "Peak memory", "MB")):
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_title(title)
+        ax.set_xlabel("n_points")
+        ax.set_ylabel(label)
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend()
+
+    fig.tight_layout()
+    fig.savefig(output, dpi=dpi)
+    plt.close(fig)
+    return output
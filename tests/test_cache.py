@@ -0,0 +1,50 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import numpy as np
+import pytest
+
+from smart_tsp_benchmark.generators.cache import InstanceCache, InstanceCacheError
+from smart_tsp_benchmark.generators.points import generate_points
+
+
+def cached_entry(directory, verify='header'):
+    cache = InstanceCache(str(directory), verify=verify)
+    points = cache.get_or_generate('random', 1000, 7)
+    key = cache.make_key('random', 1000, 7, 100.0, 5.0)
+    return cache, key, points
+
+
+def test_cache_hit_matches_generator(tmp_path):
+    cache, key, points = cached_entry(tmp_path)
+    np.testing.assert_array_equal(points, generate_points(1000, 7, method='random'))
+    np.testing.assert_array_equal(cache.load(key), points)
+
+
+def test_truncated_entry_is_rejected(tmp_path):
+    cache, key, _ = cached_entry(tmp_path)
+    path = cache.path_for(key)
+    with open(path, 'r+b') as f:
+        f.truncate(1000)
+    with pytest.raises(InstanceCacheError):
+        cache.load(key)
+    assert cache.load(key) is None
+
+
+@pytest.mark.parametrize('verify, detected', [('header', False), ('checksum', True)])
+def test_flipped_byte_needs_checksum_mode(tmp_path, verify, detected):
+    cache, key, _ = cached_entry(tmp_path, verify)
+    path = cache.path_for(key)
+    with open(path, 'r+b') as f:
+        f.seek(-1, 2)
+        last = f.read(1)
+        f.seek(-1, 2)
+        f.write(bytes([last[0] ^ 0xFF]))
+    if detected:
+        with pytest.raises(InstanceCacheError):
+            cache.load(key)
+    else:
+        assert cache.load(key) is not None
+
+
+def test_unknown_verify_mode(tmp_path):
+    with pytest.raises(ValueError):
+        InstanceCache(str(tmp_path), verify='sometimes')
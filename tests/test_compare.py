@@ -0,0 +1,50 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import time
+
+import pytest
+
+from smart_tsp_benchmark.tsp_benchmark import AlgorithmConfig, TSPBenchmark
+
+
+def stride(points, k=1):
+    return list(range(len(points)))[::k]
+
+
+def sleepy(points):
+    time.sleep(0.02)
+    return list(range(len(points)))
+
+
+def make_benchmark(params) -> TSPBenchmark:
+    benchmark = TSPBenchmark({'n_points': 60, 'verbose': False})
+    benchmark.add_algorithm('stride', AlgorithmConfig(stride, params))
+    return benchmark
+
+
+def test_params_change_is_detected(tmp_path):
+    compare = {'baseline': str(tmp_path / 'baseline.json'), 'repeats': 5, 'warmup': 0}
+    assert make_benchmark({'k': 1}).run_compare(compare)['recorded']
+
+    same = make_benchmark({'k': 1}).run_compare(compare)
+    changed = make_benchmark({'k': -1}).run_compare(compare)
+    assert not same['algorithms']['stride']['params_changed']
+    assert changed['algorithms']['stride']['params_changed']
+
+
+@pytest.mark.parametrize('repeats, alpha', [(4, 0.01), (3, 0.05), (0, 0.01)])
+def test_underpowered_repeats_are_rejected(tmp_path, repeats, alpha):
+    with pytest.raises(ValueError, match='repeats'):
+        make_benchmark({}).run_compare({'baseline': str(tmp_path / 'b.json'), 'repeats': repeats, 'alpha': alpha})
+
+
+def test_minimum_repeats_can_flag_a_slowdown(tmp_path):
+    compare = {'baseline': str(tmp_path / 'baseline.json'), 'repeats': 5, 'warmup': 0}
+    fast = TSPBenchmark({'n_points': 60, 'verbose': False})
+    fast.add_algorithm('solver', AlgorithmConfig(stride, {}))
+    fast.run_compare(compare)
+
+    slow = TSPBenchmark({'n_points': 60, 'verbose': False})
+    slow.add_algorithm('solver', AlgorithmConfig(sleepy, {}))
+    report = slow.run_compare(compare)
+    assert report['regressions'] == ['solver']
+    assert report['exit_code'] == 1
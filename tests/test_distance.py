@@ -0,0 +1,35 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import numpy as np
+import pytest
+
+from smart_tsp_benchmark.calculators.distance import DistanceOracle
+from smart_tsp_benchmark.calculators.length import calculate_length
+
+POINTS = np.random.default_rng(0).random((300, 2)) * 1000
+
+
+@pytest.mark.parametrize('strategy', ['direct', 'matrix'])
+def test_scalar_edge_costs(strategy):
+    oracle = DistanceOracle(POINTS, strategy=strategy)
+    expected = np.hypot(*(POINTS[3] - POINTS[4]))
+    assert oracle.edge_costs(3, 4) == pytest.approx(expected, rel=1e-7)
+    assert oracle.edge_costs(4, 3) == pytest.approx(expected, rel=1e-7)
+    assert oracle.edge_costs(5, 5) == 0.0
+    assert oracle.edge_costs(3, 4).shape == ()
+
+
+def test_scalar_edge_costs_after_lazy_matrix_build():
+    oracle = DistanceOracle(POINTS)
+    route = np.random.default_rng(1).permutation(len(POINTS))
+    while oracle.matrix is None:
+        oracle.length(route)
+    assert oracle.edge_costs(3, 4) == pytest.approx(np.hypot(*(POINTS[3] - POINTS[4])), rel=1e-7)
+    np.testing.assert_allclose(oracle.edge_costs([[1, 2], [2, 2]], [[2, 2], [3, 1]]).shape, (2, 2))
+
+
+def test_matrix_lengths_match_direct_lengths():
+    oracle = DistanceOracle(POINTS, strategy='matrix')
+    routes = np.array([np.random.default_rng(seed).permutation(len(POINTS)) for seed in range(20)])
+    expected = [calculate_length(POINTS, route, True) for route in routes]
+    np.testing.assert_allclose(oracle.lengths(routes, closed=True), expected, rtol=2.0 ** -24)
+    assert oracle.length(routes[0], closed=True) == pytest.approx(expected[0], rel=2.0 ** -24)
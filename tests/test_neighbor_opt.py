@@ -0,0 +1,36 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import numpy as np
+import pytest
+
+from smart_tsp_benchmark.calculators.length import calculate_length
+from smart_tsp_benchmark.optimizers.neighbor_opt import build_neighbor_lists, neighbor_post_optimize
+
+
+def coincident_points(seed: int, n: int = 100, copies: int = 4) -> np.ndarray:
+    points = np.random.default_rng(seed).random((n, 2))
+    points[1:copies] = points[0]
+    return points
+
+
+def test_neighbor_lists_exclude_self_with_duplicates():
+    points = coincident_points(0, n=20, copies=3)
+    neighbors = build_neighbor_lists(points, 8)
+    assert neighbors.shape == (20, 8)
+    assert not (neighbors == np.arange(20)[:, None]).any()
+
+
+@pytest.mark.parametrize('closed', [False, True])
+@pytest.mark.parametrize('seed', range(5))
+def test_post_optimize_terminates_with_coincident_points(seed, closed):
+    points = coincident_points(seed)
+    route = np.random.default_rng(seed).permutation(len(points))
+    optimized = neighbor_post_optimize(points, route, closed=closed)
+    assert sorted(optimized.tolist()) == list(range(len(points)))
+    assert calculate_length(points, optimized, closed) <= calculate_length(points, route, closed) + 1e-9
+
+
+@pytest.mark.parametrize('closed', [False, True])
+def test_post_optimize_terminates_on_rounded_grid(closed):
+    points = np.round(np.random.default_rng(1).random((300, 2)) * 5)
+    optimized = neighbor_post_optimize(points, np.arange(len(points)), closed=closed)
+    assert sorted(optimized.tolist()) == list(range(len(points)))
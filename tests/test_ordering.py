@@ -0,0 +1,35 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import numpy as np
+import pytest
+
+from smart_tsp_benchmark.generators.ordering import POINT_ORDERS, spatial_order
+from smart_tsp_benchmark.tsp_benchmark import AlgorithmConfig, TSPBenchmark
+
+
+@pytest.mark.parametrize('method', POINT_ORDERS)
+def test_spatial_order_is_permutation(method):
+    points = np.random.default_rng(3).random((500, 2))
+    order = spatial_order(points, method)
+    assert len(order) == len(points)
+    np.testing.assert_array_equal(np.sort(order), np.arange(len(points)))
+
+
+def test_unknown_order_rejected():
+    with pytest.raises(ValueError):
+        spatial_order(np.zeros((4, 2)), 'zigzag')
+
+
+def sweep_x(points):
+    return np.argsort(points[:, 0], kind='stable')
+
+
+@pytest.mark.parametrize('method', POINT_ORDERS)
+def test_reordered_run_matches_unordered(method):
+    results = {}
+    for order in (None, method):
+        benchmark = TSPBenchmark({'n_points': 200, 'point_order': order})
+        benchmark.add_algorithm('sweep', AlgorithmConfig(sweep_x, {}))
+        results[order] = benchmark.run_benchmark()['sweep']
+
+    assert results[method]['length'] == pytest.approx(results[None]['length'], rel=1e-12)
+    np.testing.assert_array_equal(results[method]['route'], results[None]['route'])
@@ -0,0 +1,40 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BACKEND_SCRIPT = """
+import sys
+import matplotlib
+from smart_tsp_benchmark.tsp_benchmark import AlgorithmConfig, TSPBenchmark
+
+def identity(points):
+    return list(range(len(points)))
+
+config = {'n_points': 50, 'plot_results': True, 'plot_output': sys.argv[1], 'verbose': False}
+if sys.argv[2] != '-':
+    config['plot_backend'] = sys.argv[2]
+benchmark = TSPBenchmark(config)
+benchmark.add_algorithm('identity', AlgorithmConfig(identity, {}))
+benchmark.run_benchmark()
+print(matplotlib.get_backend())
+"""
+
+
+@pytest.mark.parametrize('backend, expected', [
+    ('pdf', 'pdf'),
+    pytest.param('-', 'agg', marks=pytest.mark.skipif(not sys.platform.startswith('linux'),
+                                                     reason="Agg fallback is Linux-only")),
+])
+def test_plot_backend_is_respected_headless(tmp_path, backend, expected):
+    env = {key: value for key, value in os.environ.items()
+           if key not in ('DISPLAY', 'WAYLAND_DISPLAY', 'MPLBACKEND')}
+    env['PYTHONPATH'] = ROOT
+    output = subprocess.run([sys.executable, '-c', BACKEND_SCRIPT, str(tmp_path), backend], env=env,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip().lower() == expected
+    assert os.listdir(tmp_path) == ['identity.png']
@@ -0,0 +1,18 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import math
+
+import pytest
+
+from smart_tsp_benchmark.scaling import fit_power_law, predict_max_n, size_ladder
+
+
+def test_power_law_fit_recovers_exponent():
+    sizes = size_ladder(100, 10000, 2.0)
+    fit = fit_power_law(sizes, [3e-6 * n ** 1.5 for n in sizes])
+    assert fit['exponent'] == pytest.approx(1.5)
+    assert predict_max_n(fit, 60.0) == pytest.approx((60.0 / 3e-6) ** (1 / 1.5), rel=1e-6)
+
+
+def test_flat_curve_predicts_unbounded_size():
+    fit = {'coefficient': 3.5e-6, 'exponent': 0.0068}
+    assert math.isinf(predict_max_n(fit, 60.0))
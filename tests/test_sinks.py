@@ -0,0 +1,97 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import csv
+import json
+import os
+
+import numpy as np
+import pytest
+
+from smart_tsp_benchmark.tsp_benchmark import AlgorithmConfig, TSPBenchmark
+
+
+def identity(points):
+    return list(range(len(points)))
+
+
+def reverse(points):
+    return list(range(len(points)))[::-1]
+
+
+def make_benchmark(**config) -> TSPBenchmark:
+    benchmark = TSPBenchmark({'n_points': 50, 'verbose': False, **config})
+    benchmark.add_algorithm('identity', AlgorithmConfig(identity, {}))
+    benchmark.add_algorithm('reverse', AlgorithmConfig(reverse, {}))
+    return benchmark
+
+
+def test_results_writer_jsonl_and_csv(tmp_path):
+    results = make_benchmark(results_output=str(tmp_path)).run_benchmark()
+
+    with open(tmp_path / 'results.jsonl') as f:
+        records = [json.loads(line) for line in f]
+    assert [record['algorithm'] for record in records] == ['identity', 'reverse']
+    assert records[0]['length'] == pytest.approx(results['identity']['length'])
+    np.testing.assert_array_equal(np.load(records[1]['route_file']), results['reverse']['route'])
+
+    with open(tmp_path / 'results.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['algorithm'] for row in rows] == ['identity', 'reverse']
+    assert float(rows[1]['length']) == pytest.approx(results['reverse']['length'])
+
+
+def test_results_writer_parquet(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    benchmark = make_benchmark(results_output=str(tmp_path), results_formats=['parquet'])
+    results = benchmark.run_benchmark()
+
+    files = [name for name in os.listdir(tmp_path) if name.endswith('.parquet')]
+    assert len(files) == 1
+    rows = pq.read_table(tmp_path / files[0]).to_pylist()
+    assert [row['algorithm'] for row in rows] == ['identity', 'reverse']
+    assert rows[0]['length'] == pytest.approx(results['identity']['length'])
+    assert rows[0]['n_points'] == 50
+
+
+@pytest.mark.parametrize('formats', [['csv'], ['csv', 'parquet']])
+def test_sweep_streams_to_sinks_and_resumes(tmp_path, formats):
+    if 'parquet' in formats:
+        pytest.importorskip('pyarrow')
+    output = str(tmp_path / 'sweep.jsonl')
+    sweep = {'sizes': [20, 30], 'seeds': [1], 'warmup': 0, 'repeats': 2, 'output': output, 'formats': formats}
+
+    records = list(make_benchmark().stream_sweep(sweep))
+    assert len(records) == 4 and all(record['status'] == 'ok' for record in records)
+    with open(tmp_path / 'sweep.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 4
+    assert float(rows[0]['length_median']) == pytest.approx(records[0]['length']['median'])
+
+    resumed = make_benchmark().run_sweep(sweep)
+    assert len(resumed) == 4
+    with open(output) as f:
+        assert sum(1 for _ in f) == 4
+
+    if 'parquet' in formats:
+        import pyarrow.parquet as pq
+
+        files = [name for name in os.listdir(tmp_path) if name.endswith('.parquet')]
+        assert sum(pq.read_table(tmp_path / name).num_rows for name in files) == 4
+
+
+def scaled(points, k=1):
+    return list(range(len(points)))[::k]
+
+
+def test_sweep_resume_key_follows_params(tmp_path):
+    output = str(tmp_path / 'sweep.jsonl')
+    sweep = {'sizes': [20], 'seeds': [1], 'warmup': 0, 'repeats': 1, 'output': output}
+
+    benchmark = TSPBenchmark({'verbose': False})
+    benchmark.add_algorithm('scaled', AlgorithmConfig(scaled, {'k': 1}))
+    first = benchmark.run_sweep(sweep)
+    benchmark.add_algorithm('scaled', AlgorithmConfig(scaled, {'k': -1}))
+    second = benchmark.run_sweep(sweep)
+
+    assert json.loads(first[0]['params']) == {'k': 1}
+    assert [json.loads(record['params']) for record in second] == [{'k': -1}]
+    assert second[0]['run_id'] != first[0]['run_id']
@@ -0,0 +1,58 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import numpy as np
+import pytest
+
+from smart_tsp_benchmark.calculators.tour import as_route, route_dtype, validate_tour
+from smart_tsp_benchmark.tsp_benchmark import AlgorithmConfig, TSPBenchmark
+
+
+def test_valid_permutation():
+    assert validate_tour([2, 0, 1, 3], 4) is None
+    assert validate_tour(np.arange(5, dtype=np.uint16), 5) is None
+
+
+@pytest.mark.parametrize('route, message', [
+    ([0, 1, 2], 'visits 3 nodes'),
+    ([0, 1, 1, 3], 'repeats 1 visit'),
+    ([0, 1, 2, 4], 'out of range'),
+    ([0, 1, -1, 2], 'out of range'),
+    ([0.0, 1.0, 2.0, 3.0], 'integer'),
+    ([[0, 1], [2, 3]], 'one-dimensional'),
+    (None, 'missing'),
+])
+def test_invalid_tours(route, message):
+    assert message in validate_tour(route, 4)
+
+
+def test_as_route_normalizes_to_int32():
+    route = as_route([3, 1, 0, 2])
+    assert route.dtype == np.int32 and route.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(route, [3, 1, 0, 2])
+    assert as_route(np.arange(10, dtype=np.int64)[::-1]).dtype == np.int32
+    assert route_dtype(2 ** 31) == np.int64
+
+
+def identity(points):
+    return list(range(len(points)))
+
+
+def drops_node(points):
+    return list(range(len(points) - 1))
+
+
+def test_invalid_route_is_failed_and_not_ranked(capsys):
+    benchmark = TSPBenchmark({'n_points': 30})
+    benchmark.add_algorithm('identity', AlgorithmConfig(identity, {}))
+    benchmark.add_algorithm('broken', AlgorithmConfig(drops_node, {}))
+    results = benchmark.run_benchmark()
+
+    assert results['broken']['status'] == 'invalid'
+    assert results['broken']['length'] is None
+    assert 'visits 29 nodes' in results['broken']['error']
+    assert results['identity']['status'] == 'ok'
+
+    output = capsys.readouterr().out
+    failed, table = output.split("FAILED ALGORITHMS:")[1].split("DETAILED ALGORITHM COMPARISON")
+    assert "broken: invalid" in failed
+    assert "broken" not in table
+    assert "identity" in table
@@ -0,0 +1,124 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from smart_tsp_benchmark.optimizers.neighbor_opt import neighbor_post_optimize
+from smart_tsp_benchmark.tsp_benchmark import AlgorithmConfig, TSPBenchmark
+
+
+def make_benchmark(**config) -> TSPBenchmark:
+    benchmark = TSPBenchmark({'n_points': 200, 'verbose': False, **config})
+    benchmark.prepare_instance()
+    return benchmark
+
+
+def test_neighbor_post_optimization_keeps_closed_tours_closed():
+    benchmark = make_benchmark(closed_tour=True, use_post_optimization=True,
+                               post_optimization_strategy='neighbor')
+    config = AlgorithmConfig(lambda points: points, {})
+    for seed in range(10):
+        tour = neighbor_post_optimize(benchmark.points, np.random.default_rng(seed).permutation(200), closed=True)
+        tour = np.roll(tour, 17 * seed)
+        optimized = benchmark.apply_post_optimization(config, tour)
+        assert benchmark.evaluate_route(optimized) <= benchmark.evaluate_route(tour) + 1e-9
+
+
+def identity(points):
+    return list(range(len(points)))
+
+
+def test_run_scaling_leaves_config_untouched():
+    benchmark = TSPBenchmark({'n_points': 123, 'seed': 5, 'verbose': False})
+    benchmark.add_algorithm('identity', AlgorithmConfig(identity, {}))
+    before = dict(benchmark.benchmark_config)
+
+    curves = benchmark.run_scaling({'start': 50, 'stop': 200, 'factor': 2.0})
+    assert curves['identity']['sizes'] == [50, 100, 200]
+    assert benchmark.benchmark_config == before
+    assert benchmark.points is None
+
+    results = benchmark.run_benchmark()
+    assert results['identity']['points'] == 123
+    assert 'resources' not in results['identity']
+
+
+def test_run_compare_leaves_config_untouched(tmp_path):
+    baseline = str(tmp_path / 'baseline.json')
+    recorder = TSPBenchmark({'n_points': 60, 'seed': 3, 'verbose': False})
+    recorder.add_algorithm('identity', AlgorithmConfig(identity, {}))
+    assert recorder.run_compare({'baseline': baseline, 'repeats': 5})['recorded']
+
+    benchmark = TSPBenchmark({'n_points': 90, 'seed': 4, 'verbose': False})
+    benchmark.add_algorithm('identity', AlgorithmConfig(identity, {}))
+    before = dict(benchmark.benchmark_config)
+    report = benchmark.run_compare({'baseline': baseline, 'repeats': 5, 'time_tolerance': 10.0})
+    assert report['algorithms']['identity']['verdict'] != 'error'
+    assert benchmark.benchmark_config == before
+
+
+def test_run_instances_writes_separate_outputs(tmp_path):
+    benchmark = TSPBenchmark({'n_points': 40, 'verbose': False, 'plot_results': True,
+                              'plot_output': str(tmp_path / 'plots'), 'results_output': str(tmp_path / 'results')})
+    benchmark.add_algorithm('identity', AlgorithmConfig(identity, {}))
+    all_results = benchmark.run_instances([{'seed': 1}, {'seed': 2}, {'seed': 3, 'plot_output': str(tmp_path / 'one.png')}])
+
+    assert len(all_results) == 3
+    for index in range(3):
+        assert (tmp_path / 'results' / f'instance-{index}' / 'results.jsonl').exists()
+    assert (tmp_path / 'plots' / 'instance-0' / 'identity.png').exists()
+    assert (tmp_path / 'plots' / 'instance-1' / 'identity.png').exists()
+    assert (tmp_path / 'one.png').exists()
+    assert benchmark.benchmark_config['plot_output'] == str(tmp_path / 'plots')
+
+
+PRELOAD_SCRIPT = """
+import sys
+from smart_tsp_benchmark.tsp_benchmark import AlgorithmConfig, TSPBenchmark
+
+loaded = []
+
+class Recording(TSPBenchmark):
+    def apply_post_optimization(self, config, route):
+        loaded.append('scipy.spatial' in sys.modules)
+        return super().apply_post_optimization(config, route)
+
+def identity(points):
+    return list(range(len(points)))
+
+assert 'scipy.spatial' not in sys.modules
+benchmark = Recording({'n_points': 50, 'verbose': False, 'use_post_optimization': True,
+                       'post_optimization_strategy': 'neighbor'})
+benchmark.add_algorithm('identity', AlgorithmConfig(identity, {}))
+benchmark.run_benchmark()
+print(loaded)
+"""
+
+
+def test_neighbor_dependencies_load_before_timed_section():
+    env = {**os.environ, 'PYTHONPATH': os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}
+    output = subprocess.run([sys.executable, '-c', PRELOAD_SCRIPT], env=env, capture_output=True, text=True,
+                            check=True).stdout
+    assert output.strip() == '[True]'
+
+
+def test_evaluate_route_does_not_depend_on_matrix_state():
+    benchmark = make_benchmark()
+    route = np.random.default_rng(0).permutation(200)
+    before = benchmark.evaluate_route(route)
+    benchmark.score_routes(np.tile(route, (400, 1)))
+    assert benchmark.distance_oracle.matrix is not None
+    assert benchmark.evaluate_route(route) == before
+
+
+def test_precise_timing_keeps_harness_collections_out_of_gc_counts():
+    benchmark = TSPBenchmark({'n_points': 100, 'verbose': False, 'precise_timing': True,
+                              'profile_resources': True, 'use_post_optimization': True,
+                              'min_measure_time': 0.001})
+    benchmark.add_algorithm('identity', AlgorithmConfig(identity, {}))
+    result = benchmark.run_benchmark()['identity']
+    assert result['loops'] >= 1 and result['post_opt_loops'] >= 1
+    assert result['resources']['solve']['gc_collections'] == [0, 0, 0]
+    assert result['resources']['post_opt']['gc_collections'] == [0, 0, 0]
@@ -0,0 +1,71 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import os
+
+import numpy as np
+import pytest
+
+from smart_tsp_benchmark.loaders.tsplib import read_tour, read_tsplib
+from smart_tsp_benchmark.tsp_benchmark import AlgorithmConfig, TSPBenchmark
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+KITE = os.path.join(FIXTURES, 'kite5.tsp')
+KITE_TOUR = os.path.join(FIXTURES, 'kite5.opt.tour')
+KITE_POINTS = [[0, 0], [10, 0], [10, 10], [0, 10], [5, -5]]
+KITE_OPTIMUM = 30 + 2 * np.hypot(5, 5)
+
+
+def test_header_values_keep_colons():
+    instance = read_tsplib(KITE)
+    assert instance.name == 'kite5'
+    assert instance.header['COMMENT'] == 'Hand-made kite: square plus one point (test fixture)'
+    assert instance.edge_weight_type == 'EUC_2D'
+
+
+def test_out_of_order_ids_are_placed_by_id():
+    np.testing.assert_array_equal(read_tsplib(KITE).points, KITE_POINTS)
+
+
+def test_tour_without_dimension():
+    np.testing.assert_array_equal(read_tour(KITE_TOUR), [0, 4, 1, 2, 3])
+
+
+def test_display_data_section():
+    instance = read_tsplib(os.path.join(FIXTURES, 'explicit4.tsp'))
+    assert instance.edge_weight_type == 'EXPLICIT'
+    np.testing.assert_array_equal(instance.points, [[0, 0], [3, 0], [3, 4], [0, 4]])
+
+
+def test_gap_to_optimal_tour():
+    optimal = read_tour(KITE_TOUR)
+    benchmark = TSPBenchmark({'instance': KITE, 'optimal_tour': KITE_TOUR, 'closed_tour': True,
+                              'verbose': False})
+    benchmark.add_algorithm('optimal', AlgorithmConfig(lambda points: optimal, {}))
+    benchmark.add_algorithm('identity', AlgorithmConfig(lambda points: list(range(len(points))), {}))
+    results = benchmark.run_benchmark()
+
+    assert benchmark.optimum == pytest.approx(KITE_OPTIMUM)
+    assert results['optimal']['gap'] == pytest.approx(0.0, abs=1e-9)
+    identity_length = 30 + np.hypot(5, 15) + np.hypot(5, 5)
+    assert results['identity']['gap'] == pytest.approx((identity_length / KITE_OPTIMUM - 1) * 100)
+
+
+@pytest.mark.parametrize('reference', [{'optimum': 10.0}, {'optimal_tour': KITE_TOUR}])
+def test_gap_requires_euclidean_instance(reference):
+    benchmark = TSPBenchmark({'instance': os.path.join(FIXTURES, 'explicit4.tsp'), 'closed_tour': True,
+                              'verbose': False, **reference})
+    benchmark.add_algorithm('identity', AlgorithmConfig(lambda points: list(range(len(points))), {}))
+    with pytest.raises(ValueError, match='EUC_2D'):
+        benchmark.run_benchmark()
+
+
+def test_non_euclidean_instance_loads_without_optimum():
+    benchmark = TSPBenchmark({'instance': os.path.join(FIXTURES, 'explicit4.tsp'), 'verbose': False})
+    benchmark.add_algorithm('identity', AlgorithmConfig(lambda points: list(range(len(points))), {}))
+    assert benchmark.run_benchmark()['identity']['gap'] is None
+
+
+def test_gap_requires_closed_tours():
+    benchmark = TSPBenchmark({'instance': KITE, 'optimal_tour': KITE_TOUR, 'verbose': False})
+    benchmark.add_algorithm('identity', AlgorithmConfig(lambda points: list(range(len(points))), {}))
+    with pytest.raises(ValueError, match='closed_tour'):
+        benchmark.run_benchmark()